@@ -32,6 +32,8 @@ TESTNET_WSS_URL = "wss://api-demo.lyra.finance/ws"
 
 # Public API endpoints or DerivePerpetualClient function
 TICKER_PRICE_CHANGE_PATH_URL = "/public/get_ticker"
+MAX_CONCURRENT_TICKER_REQUESTS = 8
+TICKER_REQUEST_TIMEOUT = 20.0
 EXCHANGE_INFO_PATH_URL = "/public/get_all_currencies"
 EXCHANGE_CURRENCIES_PATH_URL = "/public/get_all_instruments"
 PING_PATH_URL = "/public/get_time"
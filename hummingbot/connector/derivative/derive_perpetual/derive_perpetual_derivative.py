@@ -64,6 +64,7 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
         self._last_trade_history_timestamp = None
         self._last_trades_poll_timestamp = 1.0
         self._instrument_ticker = []
+        self._ticker_requests_semaphore = asyncio.Semaphore(CONSTANTS.MAX_CONCURRENT_TICKER_REQUESTS)
         self.real_time_balance_update = False
         self.currencies = []
         super().__init__(balance_asset_limit, rate_limits_share_pct)
@@ -172,7 +173,7 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
             exchange_info = await self._api_post(path_url=self.trading_currencies_request_path, data=payload)
             if "error" in exchange_info:
                 if 'Instrument not found' in exchange_info['error']['message']:
-                    self.logger().debug(f"Ignoring currency {currency['currency']}: not supported sport.")
+                    self.logger().debug("Ignoring currency %s: not supported sport.", currency["currency"])
                     continue
                 self.logger().error(f"Error: {currency['message']}")
                 raise
@@ -202,7 +203,7 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
                 exchange_info = await self._api_post(path_url=self.trading_currencies_request_path, data=payload)
                 if "error" in exchange_info:
                     if 'Instrument not found' in exchange_info['error']['message']:
-                        self.logger().debug(f"Ignoring currency {currency['currency']}: not supported sport.")
+                        self.logger().debug("Ignoring currency %s: not supported sport.", currency["currency"])
                         continue
                     self.logger().warning(f"Error: {exchange_info['error']['message']}")
                     raise
@@ -221,27 +222,54 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
             exchange_infos.append(exchange_info["result"]["instruments"][0])
         return exchange_infos
 
-    async def get_all_pairs_prices(self) -> Dict[str, Any]:
-        res = []
-        tasks = []
+    async def get_all_pairs_prices(self) -> List[Dict[str, Any]]:
+        return [pair_price async for pair_price in self.iter_all_pairs_prices()]
+
+    async def iter_all_pairs_prices(self) -> AsyncIterable[Dict[str, Any]]:
+        """
+        Yields the best bid and ask of each instrument as soon as its ticker request completes, so callers can act
+        on the fastest pairs without waiting for the slowest one.
+        """
         if len(self._instrument_ticker) == 0:
             await self._make_trading_rules_request()
-        for token in self._instrument_ticker:
-            payload = {"instrument_name": token["instrument_name"]}
-            tasks.append(self._api_post(path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL, data=payload))
-        results = await safe_gather(*tasks, return_exceptions=True)
-        for result in results:
+        tasks = [
+            asyncio.create_task(self._get_instrument_best_prices(instrument_name=token["instrument_name"]))
+            for token in self._instrument_ticker
+        ]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                pair_price = await next_completed
+                if pair_price is not None:
+                    yield pair_price
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get_instrument_best_prices(self, instrument_name: str) -> Optional[Dict[str, Any]]:
+        try:
+            async with self._ticker_requests_semaphore:
+                result = await asyncio.wait_for(
+                    self._api_post(
+                        path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL, data={"instrument_name": instrument_name}
+                    ),
+                    timeout=CONSTANTS.TICKER_REQUEST_TIMEOUT,
+                )
             pair_price_data = result["result"]
-
-            data = {
-                "symbol": {
-                    "instrument_name": pair_price_data["instrument_name"],
-                    "best_bid": pair_price_data["best_bid_price"],
-                    "best_ask": pair_price_data["best_ask_price"],
-                }
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self.logger().warning(f"Timed out fetching the ticker for {instrument_name}.")
+            return None
+        except Exception:
+            self.logger().warning(f"Error fetching the ticker for {instrument_name}.", exc_info=True)
+            return None
+        return {
+            "symbol": {
+                "instrument_name": pair_price_data["instrument_name"],
+                "best_bid": pair_price_data["best_bid_price"],
+                "best_ask": pair_price_data["best_ask_price"],
             }
-            res.append(data)
-        return res
+        }
 
     def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
         return False
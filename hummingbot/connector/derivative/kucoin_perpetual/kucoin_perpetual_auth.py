@@ -5,7 +5,7 @@ import json
 import time
 from collections import OrderedDict
 from decimal import Decimal
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 
 from hummingbot.connector.derivative.kucoin_perpetual import kucoin_perpetual_constants as CONSTANTS
@@ -24,6 +24,8 @@ class KucoinPerpetualAuth(AuthBase):
         self._passphrase: str = passphrase
         self._secret_key: str = secret_key
         self._time_provider: TimeSynchronizer = time_provider
+        # The passphrase signature only depends on the credentials, so it is computed once on first use
+        self._signed_passphrase: Optional[str] = None
 
     @staticmethod
     def keysort(dictionary: Dict[str, str]) -> Dict[str, str]:
@@ -133,13 +135,14 @@ class KucoinPerpetualAuth(AuthBase):
                 self._secret_key.encode("utf-8"),
                 payload.encode("utf-8"),
                 hashlib.sha256).digest())
-        passphrase = base64.b64encode(
-            hmac.new(
-                self._secret_key.encode('utf-8'),
-                self._passphrase.encode('utf-8'),
-                hashlib.sha256).digest())
         header["KC-API-SIGN"] = str(signature, "utf-8")
-        header["KC-API-PASSPHRASE"] = str(passphrase, "utf-8")
+        if self._signed_passphrase is None:
+            self._signed_passphrase = str(base64.b64encode(
+                hmac.new(
+                    self._secret_key.encode("utf-8"),
+                    self._passphrase.encode("utf-8"),
+                    hashlib.sha256).digest()), "utf-8")
+        header["KC-API-PASSPHRASE"] = self._signed_passphrase
         partner_headers = self.partner_header(str(timestamp))
         header.update(partner_headers)
         return header
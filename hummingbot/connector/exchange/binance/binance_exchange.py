@@ -255,10 +255,10 @@ class BinanceExchange(ExchangePyBase):
         for rule in filter(binance_utils.is_exchange_information_valid, trading_pair_rules):
             try:
                 trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=rule.get("symbol"))
-                filters = rule.get("filters")
-                price_filter = [f for f in filters if f.get("filterType") == "PRICE_FILTER"][0]
-                lot_size_filter = [f for f in filters if f.get("filterType") == "LOT_SIZE"][0]
-                min_notional_filter = [f for f in filters if f.get("filterType") in ["MIN_NOTIONAL", "NOTIONAL"]][0]
+                filters = {f.get("filterType"): f for f in rule.get("filters")}
+                price_filter = filters["PRICE_FILTER"]
+                lot_size_filter = filters["LOT_SIZE"]
+                min_notional_filter = filters.get("MIN_NOTIONAL") or filters["NOTIONAL"]
 
                 min_order_size = Decimal(lot_size_filter.get("minQty"))
                 tick_size = price_filter.get("tickSize")
@@ -158,7 +158,7 @@ class CoinbaseAdvancedTradeAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 pair = await self.filter_pair(trading_pair)
                 trade_message: OrderBookMessage = CoinbaseAdvancedTradeOrderBook.trade_message_from_exchange(
                     raw_message, {"trading_pair": pair})
-                self.logger().debug(f"Order book message: {trade_message}")
+                self.logger().debug("Order book message: %s", trade_message)
                 message_queue.put_nowait(trade_message)
 
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
@@ -170,7 +170,7 @@ class CoinbaseAdvancedTradeAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 pair = await self.filter_pair(trading_pair)
                 order_book_message: OrderBookMessage = CoinbaseAdvancedTradeOrderBook.diff_message_from_exchange(
                     raw_message, time.time(), {"trading_pair": pair})
-                self.logger().debug(f"Order book message: {order_book_message}")
+                self.logger().debug("Order book message: %s", order_book_message)
                 message_queue.put_nowait(order_book_message)
 
     async def filter_pair(self, trading_pair):
@@ -1,6 +1,9 @@
+import datetime
 import re
 from typing import Callable, Dict, NamedTuple, Optional, Tuple
 
+from dateutil import parser
+
 import hummingbot.connector.exchange.coinbase_advanced_trade.coinbase_advanced_trade_constants as constants
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
@@ -131,8 +134,6 @@ def get_timestamp_from_exchange_time(exchange_time: str, unit: str) -> float:
     assert isinstance(exchange_time, str), f"exchange_time should be str, not {type(exchange_time)}: {exchange_time}"
     assert isinstance(unit, str), f"unit should be str, not {type(unit)}"
 
-    from dateutil import parser
-
     dt = parser.parse(timestr=exchange_time)
     t_s: float = dt.timestamp()
     if not isinstance(t_s, float):
@@ -154,7 +155,6 @@ def set_exchange_time_from_timestamp(timestamp: int | float, timestamp_unit: str
     elif timestamp_unit not in ("s", "second", "seconds"):
         raise ValueError(f"Unsupported timestamp unit {timestamp_unit}")
 
-    import datetime
     return f"{datetime.datetime.fromtimestamp(timestamp, datetime.UTC).isoformat()}"
 
 
@@ -457,6 +457,20 @@ class CubeExchange(ExchangePyBase):
         """
         pass
 
+    async def _process_position(self, position: trade_pb2.AssetPosition):
+        """
+        Updates the total and available balances of the position's asset, converting from raw units with the
+        asset decimals. Shared by the bootstrap snapshot and the live position updates.
+        """
+        token_id_map = await self.token_id_map()
+        token_symbol = token_id_map[position.asset_id]
+        token_info = await self.token_info()
+        decimals = token_info.get(position.asset_id, {}).get("decimals", 1)
+        scale = 10 ** decimals
+
+        self._account_balances[token_symbol] = Decimal(raw_units_to_number(position.total) / scale)
+        self._account_available_balances[token_symbol] = Decimal(raw_units_to_number(position.available) / scale)
+
     async def _user_stream_event_listener(self):
         """
         This functions runs in background continuously processing the events received from the exchange by the user
@@ -474,16 +488,7 @@ class CubeExchange(ExchangePyBase):
                     if msg.HasField("position"):
                         for position in msg.position.positions:
                             if position.subaccount_id == self.cube_subaccount_id:
-                                token_id_map = await self.token_id_map()
-                                token_symbol = token_id_map[position.asset_id]
-
-                                token_info = await self.token_info()
-                                decimals = token_info.get(position.asset_id, {}).get("decimals", 1)
-
-                                self._account_balances[token_symbol] = Decimal(raw_units_to_number(position.total) / (
-                                    10 ** decimals))
-                                self._account_available_balances[token_symbol] = Decimal(raw_units_to_number(
-                                    position.available) / (10 ** decimals))
+                                await self._process_position(position)
 
                 else:
                     msg: trade_pb2.OrderResponse = trade_pb2.OrderResponse().FromString(event_message)
@@ -538,15 +543,7 @@ class CubeExchange(ExchangePyBase):
 
                     if msg.HasField("position"):
                         if msg.position.subaccount_id == self.cube_subaccount_id:
-                            # token_symbol = self.token_id_to_token_symbol(msg.position.asset_id)
-                            token_id_map = await self.token_id_map()
-                            token_symbol = token_id_map[msg.position.asset_id]
-                            token_info = await self.token_info()
-                            decimals = token_info.get(msg.position.asset_id, {}).get("decimals", 1)
-                            self._account_balances[token_symbol] = Decimal(raw_units_to_number(msg.position.total) / (
-                                10 ** decimals))
-                            self._account_available_balances[token_symbol] = Decimal(raw_units_to_number(
-                                msg.position.available) / (10 ** decimals))
+                            await self._process_position(msg.position)
 
                     if msg.HasField("fill"):
                         client_order_id = str(msg.fill.client_order_id)
@@ -862,23 +859,20 @@ class CubeExchange(ExchangePyBase):
         for asset in assets.values():
             mapping_token_id[asset["assetId"]] = asset["symbol"].upper()
 
-        self.logger().debug(f"markets: {markets}")
+        self.logger().debug("markets: %s", markets)
 
         for market in filter(cube_utils.is_exchange_information_valid, markets):
-            self.logger().debug(f"Processing market {market}")
             base_asset = assets[market.get("baseAssetId")]
             quote_asset = assets[market.get("quoteAssetId")]
-            mapping_symbol[market["symbol"].upper()] = combine_to_hb_trading_pair(
+            trading_pair = combine_to_hb_trading_pair(
                 base=base_asset["symbol"].upper(), quote=quote_asset["symbol"].upper()
             )
+            mapping_symbol[market["symbol"].upper()] = trading_pair
             try:
-                mapping_market_id[market.get("marketId")] = combine_to_hb_trading_pair(
-                    base=base_asset["symbol"].upper(), quote=quote_asset["symbol"].upper()
-                )
+                mapping_market_id[market.get("marketId")] = trading_pair
             except ValueDuplicationError:
                 # Ignore the error if the key already exists
-                self.logger().debug(f"Duplicate key found for {market.get('marketId')}")
-                pass
+                self.logger().debug("Duplicate key found for %s", market.get("marketId"))
 
         self._set_trading_pair_symbol_map(mapping_symbol)
         self._set_trading_pair_market_id_map(mapping_market_id)
@@ -113,7 +113,7 @@ class DeriveAuth(AuthBase):
             ACTION_TYPEHASH=action_typehash,  # from Protocol Constants table in docs.derive.xyz
         )
         try:
-            action.sign(self.session_key_wallet.key)
+            action.sign_with_account(self.session_key_wallet)
         except Exception as e:
             raise Exception(f"Error signing action: {e}")
 
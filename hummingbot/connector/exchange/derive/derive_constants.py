@@ -30,6 +30,8 @@ TESTNET_WSS_URL = "wss://api-demo.lyra.finance/ws"
 
 # Public API endpoints or DeriveClient function
 TICKER_PRICE_CHANGE_PATH_URL = "/public/get_ticker"
+MAX_CONCURRENT_TICKER_REQUESTS = 8
+TICKER_REQUEST_TIMEOUT = 20.0
 TICKER_BOOK_PATH_URL = "/public/get_ticker"
 PRICES_PATH_URL = "/public/get_ticker"
 EXCHANGE_INFO_PATH_URL = "/public/get_all_currencies"
@@ -1,12 +1,12 @@
 import asyncio
+import json
 from asyncio import Lock
-from decimal import Decimal
 from typing import Dict, List
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from hexbytes import HexBytes
-from web3 import AsyncWeb3, Web3
+from web3 import AsyncWeb3
 
 from hummingbot.connector.utils import to_0x_hex
 
@@ -15,13 +15,14 @@ try:
 except ImportError:
     from web3.middleware import ExtraDataToPOAMiddleware as async_geth_poa_middleware
 
-from hummingbot.connector.exchange.dexalot import dexalot_constants as CONSTANTS
+from hummingbot.connector.exchange.dexalot import dexalot_constants as CONSTANTS, dexalot_utils
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.core.data_type.common import OrderType, TradeType
 
-DEXALOT_TRADEPAIRS_ABI = '[{"name": "cancelAddList", "type": "function", "inputs": [{"name": "_orderIdsToCancel", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "_orders", "type": "tuple[]", "components": [{"name": "clientOrderId", "type": "bytes32", "internalType": "bytes32"}, {"name": "tradePairId", "type": "bytes32", "internalType": "bytes32"}, {"name": "price", "type": "uint256", "internalType": "uint256"}, {"name": "quantity", "type": "uint256", "internalType": "uint256"}, {"name": "traderaddress", "type": "address", "internalType": "address"}, {"name": "side", "type": "uint8", "internalType": "enum ITradePairs.Side"}, {"name": "type1", "type": "uint8", "internalType": "enum ITradePairs.Type1"}, {"name": "type2", "type": "uint8", "internalType": "enum ITradePairs.Type2"}, {"name": "stp", "type": "uint8", "internalType": "enum ITradePairs.STP"}], "internalType": "struct ITradePairs.NewOrder[]"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "addOrderList", "type": "function", "inputs": [{"name": "_orders", "type": "tuple[]", "components": [{"name": "clientOrderId", "type": "bytes32", "internalType": "bytes32"}, {"name": "tradePairId", "type": "bytes32", "internalType": "bytes32"}, {"name": "price", "type": "uint256", "internalType": "uint256"}, {"name": "quantity", "type": "uint256", "internalType": "uint256"}, {"name": "traderaddress", "type": "address", "internalType": "address"}, {"name": "side", "type": "uint8", "internalType": "enum ITradePairs.Side"}, {"name": "type1", "type": "uint8", "internalType": "enum ITradePairs.Type1"}, {"name": "type2", "type": "uint8", "internalType": "enum ITradePairs.Type2"}, {"name": "stp", "type": "uint8", "internalType": "enum ITradePairs.STP"}], "internalType": "struct ITradePairs.NewOrder[]"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "cancelOrderList", "type": "function", "inputs": [{"name": "_orderIds", "type": "bytes32[]", "internalType": "bytes32[]"}], "outputs": [], "stateMutability": "nonpayable"}]'
+# Parsed once at import so each client reuses the same ABI definitions
+DEXALOT_TRADEPAIRS_ABI = json.loads('[{"name": "cancelAddList", "type": "function", "inputs": [{"name": "_orderIdsToCancel", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "_orders", "type": "tuple[]", "components": [{"name": "clientOrderId", "type": "bytes32", "internalType": "bytes32"}, {"name": "tradePairId", "type": "bytes32", "internalType": "bytes32"}, {"name": "price", "type": "uint256", "internalType": "uint256"}, {"name": "quantity", "type": "uint256", "internalType": "uint256"}, {"name": "traderaddress", "type": "address", "internalType": "address"}, {"name": "side", "type": "uint8", "internalType": "enum ITradePairs.Side"}, {"name": "type1", "type": "uint8", "internalType": "enum ITradePairs.Type1"}, {"name": "type2", "type": "uint8", "internalType": "enum ITradePairs.Type2"}, {"name": "stp", "type": "uint8", "internalType": "enum ITradePairs.STP"}], "internalType": "struct ITradePairs.NewOrder[]"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "addOrderList", "type": "function", "inputs": [{"name": "_orders", "type": "tuple[]", "components": [{"name": "clientOrderId", "type": "bytes32", "internalType": "bytes32"}, {"name": "tradePairId", "type": "bytes32", "internalType": "bytes32"}, {"name": "price", "type": "uint256", "internalType": "uint256"}, {"name": "quantity", "type": "uint256", "internalType": "uint256"}, {"name": "traderaddress", "type": "address", "internalType": "address"}, {"name": "side", "type": "uint8", "internalType": "enum ITradePairs.Side"}, {"name": "type1", "type": "uint8", "internalType": "enum ITradePairs.Type1"}, {"name": "type2", "type": "uint8", "internalType": "enum ITradePairs.Type2"}, {"name": "stp", "type": "uint8", "internalType": "enum ITradePairs.STP"}], "internalType": "struct ITradePairs.NewOrder[]"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "cancelOrderList", "type": "function", "inputs": [{"name": "_orderIds", "type": "bytes32[]", "internalType": "bytes32[]"}], "outputs": [], "stateMutability": "nonpayable"}]')
 
-DEXALOT_PORTFOLIOSUB_ABI = '[{"name": "getBalances", "type": "function", "inputs": [{"name": "_owner", "type": "address", "internalType": "address"}, {"name": "_pageNo", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "symbols", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "total", "type": "uint256[]", "internalType": "uint256[]"}, {"name": "available", "type": "uint256[]", "internalType": "uint256[]"}], "stateMutability": "view"}]'
+DEXALOT_PORTFOLIOSUB_ABI = json.loads('[{"name": "getBalances", "type": "function", "inputs": [{"name": "_owner", "type": "address", "internalType": "address"}, {"name": "_pageNo", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "symbols", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "total", "type": "uint256[]", "internalType": "uint256[]"}, {"name": "available", "type": "uint256[]", "internalType": "uint256[]"}], "stateMutability": "view"}]')
 
 
 class DexalotClient:
@@ -38,6 +39,8 @@ class DexalotClient:
         self._domain = domain
         self._trading_required = trading_required
         self.last_nonce = 0
+        self._nonce_synced = False
+        self._chain_id = None
         self.transaction_lock = Lock()
         self.balance_evm_params = {}
 
@@ -48,7 +51,6 @@ class DexalotClient:
             or self.trading_capability else None  # See the above comment for details
         self.async_w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.provider))
         self.async_w3.eth.default_account = self.account.address if self.account else None
-        self._w3 = Web3(Web3.HTTPProvider(self.provider))
         self.async_w3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
         self.async_w3.strict_bytes_type_checking = False
         TRADEPAIRS_ADDRESS = CONSTANTS.DEXALOT_TRADEPAIRS_ADDRESS if self._domain == "dexalot" else CONSTANTS.TESTNET_DEXALOT_TRADEPAIRS_ADDRESS
@@ -85,16 +87,16 @@ class DexalotClient:
         balances = await self.portfolio_sub_manager.functions.getBalances(self.account.address, 50).call()
         coin_list = balances[0]
         total_list = balances[1]
-        for index, evm_total_balance in enumerate(total_list):
+        for coin_bytes, evm_total_balance in zip(coin_list, total_list):
             if evm_total_balance != 0:
-                coin = coin_list[index].decode('utf-8').rstrip('\x00')
-                for k, v in self.balance_evm_params.items():
-                    if k == coin:
-                        evmdecimals = v["token_evmdecimals"]
-                        total_balance = evm_total_balance * Decimal(f'1e-{evmdecimals}')
-                        account_balances[coin.upper()] = total_balance
-                        account_available_balances[coin.upper()] = total_balance
-                        break
+                coin = coin_bytes.decode('utf-8').rstrip('\x00')
+                token_params = self.balance_evm_params.get(coin)
+                if token_params is not None:
+                    evmdecimals = token_params["token_evmdecimals"]
+                    total_balance = evm_total_balance * dexalot_utils.power_of_ten(-int(evmdecimals))
+                    asset_name = coin.upper()
+                    account_balances[asset_name] = total_balance
+                    account_available_balances[asset_name] = total_balance
         return account_balances, account_available_balances
 
     async def cancel_and_add_order_list(
@@ -105,14 +107,17 @@ class DexalotClient:
         if order_list:
             symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=order_list[0].trading_pair)
             pairByte32 = HexBytes(symbol.encode('utf-8'))
-            trader_address = Account.from_key(self._private_key).address
+            trader_address = self.account.address
+            # All orders in the batch share the first order's trading pair, so its scaling factors are resolved once
+            evm_params = self._connector._evm_params[order_list[0].trading_pair]
+            price_scale = dexalot_utils.power_of_ten(evm_params["base_evmdecimals"])
+            quantity_scale = dexalot_utils.power_of_ten(evm_params["quote_evmdecimals"])
             for order in order_list:
-                trading_pair = order_list[0].trading_pair
                 _trade_address = trader_address
                 _client_order_id = order.client_order_id
                 _trade_pair_id = pairByte32
-                _price = int(order.price * 10 ** self._connector._evm_params[trading_pair]["base_evmdecimals"])
-                _quantity = int(order.amount * 10 ** self._connector._evm_params[trading_pair]["quote_evmdecimals"])
+                _price = int(order.price * price_scale)
+                _quantity = int(order.amount * quantity_scale)
                 _side = 1 if order.trade_type == TradeType.SELL else 0
                 _type1 = 0 if order.order_type is OrderType.MARKET else 1
                 _type2 = 3 if order.order_type == OrderType.LIMIT_MAKER else 0
@@ -142,18 +147,28 @@ class DexalotClient:
         """
         async with self.transaction_lock:
             result = None
+            # The chain id never changes for a client, so it is fetched once instead of by every build_transaction
+            if self._chain_id is None:
+                self._chain_id = await self.async_w3.eth.chain_id
             for retry_attempt in range(CONSTANTS.TRANSACTION_REQUEST_ATTEMPTS):
-                current_nonce = await self.async_w3.eth.get_transaction_count(self.account.address)
+                # The nonce is tracked locally after a successful submission and only re-synchronized with the chain
+                # for the first transaction or after a failed attempt
+                current_nonce = self.last_nonce
+                if not self._nonce_synced:
+                    current_nonce = await self.async_w3.eth.get_transaction_count(self.account.address)
+                self._nonce_synced = False
                 try:
+                    nonce = current_nonce if current_nonce > self.last_nonce else self.last_nonce
                     tx_params = {
-                        'nonce': current_nonce if current_nonce > self.last_nonce else self.last_nonce,
+                        'nonce': nonce,
                         'gas': gas,
+                        'chainId': self._chain_id,
                     }
                     transaction = await function.build_transaction(tx_params)
-                    signed_txn = self.async_w3.eth.account.sign_transaction(
-                        transaction, private_key=self._private_key
-                    )
+                    signed_txn = self.account.sign_transaction(transaction)
                     result = to_0x_hex(await self.async_w3.eth.send_raw_transaction(signed_txn.raw_transaction))
+                    self.last_nonce = nonce + 1
+                    self._nonce_synced = True
                     return result
                 except ValueError as e:
                     self._connector.logger().warning(
@@ -47,6 +47,10 @@ ONE_DAY = 86400
 TRANSACTION_REQUEST_ATTEMPTS = 5
 RETRY_INTERVAL = 2
 
+# How long cancel_all waits for cancelled orders to leave the active orders, and how often it checks
+CANCEL_ALL_CONFIRMATION_TIMEOUT = 2
+CANCEL_ALL_CONFIRMATION_POLL_INTERVAL = 0.1
+
 MAX_REQUEST = 200
 
 # Order States
@@ -59,6 +63,12 @@ ORDER_STATE = {
     "EXPIRED": OrderState.FAILED,
 }
 
+# Order status and side values as sent by the REST (names) and websocket (codes) APIs
+ORDER_STATUS_NEW = frozenset(["NEW", 0])
+ORDER_STATUS_PARTIAL = 2
+ORDER_STATUS_CANCELED = frozenset(["CANCELED", 4])
+ORDER_SIDE_BUY = frozenset(["BUY", 0])
+
 USER_TRADES_ENDPOINT_NAME = "executionEvent"
 USER_ORDERS_ENDPOINT_NAME = "orderStatusUpdateEvent"
 
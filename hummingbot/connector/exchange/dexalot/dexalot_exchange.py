@@ -1,5 +1,6 @@
 import asyncio
 import hashlib
+import time
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -28,7 +29,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -60,6 +61,7 @@ class DexalotExchange(ExchangePyBase):
         self._queued_orders_task = None
 
         self._evm_params = {}
+        self._pair_coins: Dict[str, Tuple[str, str]] = {}
         self._tx_client: DexalotClient = self._create_tx_client()
 
         super().__init__(balance_asset_limit, rate_limits_share_pct)
@@ -169,8 +171,8 @@ class DexalotExchange(ExchangePyBase):
 
         base_evmdecimals = self._evm_params[trading_pair].get("base_evmdecimals")
         quote_evmdecimals = self._evm_params[trading_pair].get("quote_evmdecimals")
-        base_amount = base_evm_amount * Decimal(f"1e-{base_evmdecimals}")
-        quote_amount = quote_evm_amount * Decimal(f"1e-{quote_evmdecimals}")
+        base_amount = base_evm_amount * dexalot_utils.power_of_ten(-int(base_evmdecimals))
+        quote_amount = quote_evm_amount * dexalot_utils.power_of_ten(-int(quote_evmdecimals))
 
         return base_amount, quote_amount
 
@@ -178,8 +180,8 @@ class DexalotExchange(ExchangePyBase):
 
         base_evmdecimals = self._evm_params[trading_pair].get("base_evmdecimals")
         quote_evmdecimals = self._evm_params[trading_pair].get("quote_evmdecimals")
-        base_evm_amount = base_amount * Decimal(f"1e{base_evmdecimals}")
-        quote_evm_amount = quote_amount * Decimal(f"1e{quote_evmdecimals}")
+        base_evm_amount = base_amount * dexalot_utils.power_of_ten(base_evmdecimals)
+        quote_evm_amount = quote_amount * dexalot_utils.power_of_ten(quote_evmdecimals)
 
         return base_evm_amount, quote_evm_amount
 
@@ -309,8 +311,13 @@ class DexalotExchange(ExchangePyBase):
                     exc_info=True,
                     app_warning_msg="Failed to cancel order. Check API key and network connection."
                 )
-        # Give some time for cancellation events to trigger
-        await asyncio.sleep(2)
+        # Give some time for cancellation events to trigger, returning as soon as every successfully cancelled
+        # order has left the active orders
+        cancelled_order_ids = [cr.order_id for cr in successful_cancellations]
+        deadline = time.monotonic() + CONSTANTS.CANCEL_ALL_CONFIRMATION_TIMEOUT
+        while (time.monotonic() < deadline
+               and any(order_id in self._order_tracker.active_orders for order_id in cancelled_order_ids)):
+            await asyncio.sleep(CONSTANTS.CANCEL_ALL_CONFIRMATION_POLL_INTERVAL)
         failed_cancellations = [CancellationResult(oid, False) for oid in incomplete_orders.keys()]
         return successful_cancellations + failed_cancellations
 
@@ -526,8 +533,8 @@ class DexalotExchange(ExchangePyBase):
         for rule in filter(dexalot_utils.is_exchange_information_valid, trading_pair_rules):
             try:
                 trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=rule.get("pair"))
-                min_order_size = Decimal(f"1e-{rule['basedisplaydecimals']}")
-                min_price_inc = Decimal(f"1e-{rule['quotedisplaydecimals']}")
+                min_order_size = dexalot_utils.power_of_ten(-int(rule['basedisplaydecimals']))
+                min_price_inc = dexalot_utils.power_of_ten(-int(rule['quotedisplaydecimals']))
                 min_notional = Decimal(rule['mintrade_amnt'])
                 retval.append(
                     TradingRule(trading_pair,
@@ -622,11 +629,10 @@ class DexalotExchange(ExchangePyBase):
             if trade["data"].get("addressMaker", "") == self.api_key else trade["data"].get("takerOrder", "")
         all_orders = self._order_tracker.all_fillable_orders
         self._calculate_available_balance_from_trades(trade["data"])
-        try:
-            for k, v in all_orders.items():
-                await v.get_exchange_order_id()
-        except Exception:
-            pass
+        # Wait for any orders still missing their exchange id together, so a slow order does not delay the rest
+        pending_orders = [o for o in all_orders.values() if o.exchange_order_id is None]
+        if len(pending_orders) > 0:
+            await safe_gather(*[o.get_exchange_order_id() for o in pending_orders], return_exceptions=True)
         _cli_tracked_orders = [o for o in all_orders.values() if exchange_order_id == o.exchange_order_id]
         if len(_cli_tracked_orders) == 0 or _cli_tracked_orders[0] is None:
             order_update: OrderUpdate = await self._request_order_status(tracked_order=None,
@@ -672,9 +678,16 @@ class DexalotExchange(ExchangePyBase):
         order_update = self._create_order_update_with_order_status_data(order_status=order_msg, order=tracked_order)
         self._order_tracker.process_order_update(order_update=order_update)
 
+    def _coins_for_pair(self, pair: str) -> Tuple[str, str]:
+        coins = self._pair_coins.get(pair)
+        if coins is None:
+            base, quote = pair.split("/")[:2]
+            coins = (base.upper(), quote.upper())
+            self._pair_coins[pair] = coins
+        return coins
+
     def _calculate_available_balance_from_trades(self, trade_msg: Dict):
-        base_coin = trade_msg["pair"].split("/")[0].upper()
-        quote_coin = trade_msg["pair"].split("/")[1].upper()
+        base_coin, quote_coin = self._coins_for_pair(trade_msg["pair"])
 
         is_maker = True if trade_msg.get("addressMaker", "") == self.api_key else False
         takerSide = trade_msg.get("takerSide")
@@ -713,17 +726,18 @@ class DexalotExchange(ExchangePyBase):
 
     def _calculate_available_balance_from_orders(self, order_msg: Dict):
         if order_msg.get("pair"):
-            base_coin = order_msg["pair"].split("/")[0].upper()
-            quote_coin = order_msg["pair"].split("/")[1].upper()
-            if order_msg["status"] in ["NEW", 0]:
-                if order_msg["side"] == "BUY" or order_msg["side"] == 0:
+            base_coin, quote_coin = self._coins_for_pair(order_msg["pair"])
+            status = order_msg["status"]
+            is_buy = order_msg["side"] in CONSTANTS.ORDER_SIDE_BUY
+            if status in CONSTANTS.ORDER_STATUS_NEW:
+                if is_buy:
                     quote_collateral_value = Decimal(order_msg.get("price")) * Decimal(order_msg.get("quantity"))
                     self._account_available_balances[quote_coin] -= quote_collateral_value
                 else:
                     base_collateral_value = Decimal(order_msg["quantity"])
                     self._account_available_balances[base_coin] -= base_collateral_value
             # Partial status used to update _account_available_balances during update_balance
-            if order_msg["status"] in [2]:
+            if status == CONSTANTS.ORDER_STATUS_PARTIAL:
                 if order_msg["side"] == 0:  # BUY
                     quote_collateral_unfilled_value = \
                         Decimal(order_msg["price"]) * Decimal(order_msg["quantity"]) - Decimal(order_msg["totalamount"])
@@ -732,8 +746,8 @@ class DexalotExchange(ExchangePyBase):
                     base_collateral_unfilled_value = Decimal(order_msg["quantity"]) - Decimal(
                         order_msg["quantityfilled"])
                     self._account_available_balances[base_coin] -= base_collateral_unfilled_value
-            if order_msg["status"] in ["CANCELED", 4]:
-                if order_msg["side"] == "BUY" or order_msg["side"] == 0:
+            if status in CONSTANTS.ORDER_STATUS_CANCELED:
+                if is_buy:
                     quote_collateral_value = Decimal(order_msg.get("price")) * Decimal(order_msg.get("quantity"))
                     quote_filled_value = Decimal(order_msg.get("totalamount") or order_msg.get("totalAmount"))
                     self._account_available_balances[quote_coin] += quote_collateral_value
@@ -793,20 +807,18 @@ class DexalotExchange(ExchangePyBase):
                 tracked_order.trading_pair
             )
             return order_update
-        if not tracked_order:
-            all_fillable_orders_by_exchange_order_id = {
-                order.exchange_order_id: order for order in self._order_tracker.all_fillable_orders.values()
-            }
-            tracked_order = all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
-
         updated_order_data = await self._api_get(
             path_url=CONSTANTS.ORDER_PATH_URL.format(exchange_order_id),
             params={},
             is_auth_required=True,
             limit_id=CONSTANTS.IP_REQUEST_WEIGHT)
         client_order_id = updated_order_data.get("clientOrderId")
-        tracked_order = self._order_tracker.all_fillable_orders.get(
-            client_order_id) if not tracked_order else tracked_order
+        if not tracked_order:
+            # The client order id in the response is a direct key into the tracker; only scan by exchange id without it
+            fillable_orders = self._order_tracker.all_fillable_orders
+            tracked_order = fillable_orders.get(client_order_id) or next(
+                (order for order in fillable_orders.values() if order.exchange_order_id == exchange_order_id), None
+            )
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
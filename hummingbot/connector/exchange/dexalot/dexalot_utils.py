@@ -15,6 +15,22 @@ DEFAULT_FEES = TradeFeeSchema(
     buy_percent_fee_deducted_from_returns=True
 )
 
+# Powers of ten for every EVM/display decimals value Dexalot uses, so they are not re-parsed from strings per call
+POWERS_OF_TEN = {exponent: Decimal(1).scaleb(exponent) for exponent in range(-40, 41)}
+
+
+def power_of_ten(exponent: Any) -> Decimal:
+    """
+    Returns 10 ** exponent as a Decimal, served from a precomputed table for the usual decimals range
+    :param exponent: the exponent (int, numeric string or Decimal)
+    :return: the power of ten
+    """
+    exponent = int(exponent)
+    power = POWERS_OF_TEN.get(exponent)
+    if power is None:
+        power = Decimal(1).scaleb(exponent)
+    return power
+
 
 def is_exchange_information_valid(exchange_info: Dict[str, Any]) -> bool:
     """
@@ -2,7 +2,7 @@ import base64
 import hashlib
 import hmac
 from collections import OrderedDict
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
 from hummingbot.connector.exchange.kucoin import kucoin_constants as CONSTANTS
@@ -17,6 +17,8 @@ class KucoinAuth(AuthBase):
         self.passphrase: str = passphrase
         self.secret_key: str = secret_key
         self.time_provider = time_provider
+        # The passphrase signature only depends on the credentials, so it is computed once on first use
+        self._signed_passphrase: Optional[str] = None
 
     @staticmethod
     def keysort(dictionary: Dict[str, str]) -> Dict[str, str]:
@@ -83,13 +85,14 @@ class KucoinAuth(AuthBase):
                 self.secret_key.encode("utf-8"),
                 payload.encode("utf-8"),
                 hashlib.sha256).digest())
-        passphrase = base64.b64encode(
-            hmac.new(
-                self.secret_key.encode('utf-8'),
-                self.passphrase.encode('utf-8'),
-                hashlib.sha256).digest())
         header["KC-API-SIGN"] = str(signature, "utf-8")
-        header["KC-API-PASSPHRASE"] = str(passphrase, "utf-8")
+        if self._signed_passphrase is None:
+            self._signed_passphrase = str(base64.b64encode(
+                hmac.new(
+                    self.secret_key.encode("utf-8"),
+                    self.passphrase.encode("utf-8"),
+                    hashlib.sha256).digest()), "utf-8")
+        header["KC-API-PASSPHRASE"] = self._signed_passphrase
         partner_headers = self.partner_header(str(timestamp))
         header.update(partner_headers)
         return header
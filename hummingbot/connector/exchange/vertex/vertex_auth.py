@@ -1,5 +1,5 @@
 import time
-from typing import Any, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import sha3
 from coincurve import PrivateKey
@@ -20,6 +20,8 @@ class VertexAuth(AuthBase):
     def __init__(self, vertex_arbitrum_address: str, vertex_arbitrum_private_key: str):
         self.sender_address = vertex_arbitrum_address
         self.private_key = vertex_arbitrum_private_key
+        self._signing_key: Optional[PrivateKey] = None
+        self._domains: Dict[Tuple[str, int], Any] = {}
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -60,14 +62,15 @@ class VertexAuth(AuthBase):
         :return: a tuple for both a string hex of the signature of the EIP712 payload and a string hex of
         the digest
         """
-        domain = make_domain(name="Vertex", version=CONSTANTS.VERSION, chainId=chain_id, verifyingContract=contract)
+        domain = self._get_domain(contract=contract, chain_id=chain_id)
 
         signable_bytes = payload.signable_bytes(domain)
         # Digest for order tracking in Hummingbot
         digest = self.generate_digest(signable_bytes)
 
-        pk = PrivateKey.from_hex(self.private_key)
-        signature = pk.sign_recoverable(signable_bytes, hasher=keccak_hash)
+        if self._signing_key is None:
+            self._signing_key = PrivateKey.from_hex(self.private_key)
+        signature = self._signing_key.sign_recoverable(signable_bytes, hasher=keccak_hash)
 
         v = signature[64] + 27
         r = big_endian_to_int(signature[0:32])
@@ -76,6 +79,18 @@ class VertexAuth(AuthBase):
         final_sig = r.to_bytes(32, "big") + s.to_bytes(32, "big") + v.to_bytes(1, "big")
         return to_0x_hex(final_sig), digest
 
+    def _get_domain(self, contract: str, chain_id: int) -> Any:
+        """
+        Returns the EIP712 domain struct for the contract and chain, building it only the first time it is requested.
+        The domain is constant for a given contract, so it is reused across every order and cancel signature.
+        """
+        key = (contract, chain_id)
+        domain = self._domains.get(key)
+        if domain is None:
+            domain = make_domain(name="Vertex", version=CONSTANTS.VERSION, chainId=chain_id, verifyingContract=contract)
+            self._domains[key] = domain
+        return domain
+
     def generate_digest(self, signable_bytes: bytearray) -> str:
         """
         Generates the digest of the payload for use across Vetext lookups
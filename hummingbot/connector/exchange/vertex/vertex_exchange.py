@@ -23,6 +23,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -53,6 +54,10 @@ class VertexExchange(ExchangePyBase):
         self._symbols = {}
         self._contracts = {}
         self._chain_id = CONSTANTS.CHAIN_IDS[self.domain]
+        # NOTE: Dynamically adjust this
+        self._endpoint_contract = CONSTANTS.CONTRACTS[self.domain]
+        self._fees_by_rate: Dict[Decimal, TradeFeeBase] = {}
+        self._matches_by_product: Dict[int, Tuple[float, Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any]]]] = {}
         super().__init__(balance_asset_limit, rate_limits_share_pct)
 
     @staticmethod
@@ -188,7 +193,11 @@ class VertexExchange(ExchangePyBase):
                 fee_value = fee_data["maker"]
             else:
                 fee_value = fee_data["taker"]
-            fee = AddedToCostTradeFee(percent=fee_value)
+            # NOTE: Fee objects are immutable in practice, so one instance is shared per rate
+            fee = self._fees_by_rate.get(fee_value)
+            if fee is None:
+                fee = AddedToCostTradeFee(percent=fee_value)
+                self._fees_by_rate[fee_value] = fee
         return fee
 
     async def _place_order(
@@ -214,9 +223,11 @@ class VertexExchange(ExchangePyBase):
         else:
             _order_type = CONSTANTS.TIME_IN_FORCE_GTC
 
-        expiration = utils.generate_expiration(time.time(), order_type=_order_type)
+        # NOTE: Expiration and nonce are derived from the same instant so they stay consistent with each other
+        now = time.time()
+        expiration = utils.generate_expiration(now, order_type=_order_type)
         product_id = utils.trading_pair_to_product_id(trading_pair, self._exchange_market_info[self._domain])
-        nonce = utils.generate_nonce(time.time())
+        nonce = utils.generate_nonce(now)
 
         contract = self._exchange_market_info[self._domain][product_id]["contract"]
 
@@ -226,7 +237,7 @@ class VertexExchange(ExchangePyBase):
             sender=sender, priceX18=int(price_str), amount=int(amount_str), expiration=int(expiration), nonce=nonce
         )
 
-        signature, digest = self.authenticator.sign_payload(order, contract, self._chain_id)
+        signature, digest = self._auth.sign_payload(order, contract, self._chain_id)
 
         place_order = {
             "place_order": {
@@ -267,8 +278,6 @@ class VertexExchange(ExchangePyBase):
             tracked_order.trading_pair, self._exchange_market_info[self._domain]
         )
         nonce = utils.generate_nonce(time.time())
-        # NOTE: Dynamically adjust this
-        endpoint_contract = CONSTANTS.CONTRACTS[self.domain]
 
         if tracked_order.exchange_order_id:
             order_id = tracked_order.exchange_order_id
@@ -280,7 +289,7 @@ class VertexExchange(ExchangePyBase):
         cancel = vertex_eip712_structs.Cancellation(
             sender=sender, productIds=[int(product_id)], digests=[order_id_bytes], nonce=nonce
         )
-        signature, digest = self.authenticator.sign_payload(cancel, endpoint_contract, self._chain_id)
+        signature, digest = self._auth.sign_payload(cancel, self._endpoint_contract, self._chain_id)
 
         cancel_orders = {
             "cancel_orders": {
@@ -432,12 +441,13 @@ class VertexExchange(ExchangePyBase):
                     "taker": Decimal(utils.convert_from_x18(taker_fees[product_id])),
                 }
         except Exception:
-            # NOTE: If failure to fetch, build default fees
+            # NOTE: If failure to fetch, build default fees. The entry is never mutated, so all pairs share it
+            default_fees = {
+                "maker": utils.DEFAULT_FEES.maker_percent_fee_decimal,
+                "taker": utils.DEFAULT_FEES.taker_percent_fee_decimal,
+            }
             for trading_pair in self._trading_pairs:
-                self._trading_fees[trading_pair] = {
-                    "maker": utils.DEFAULT_FEES.maker_percent_fee_decimal,
-                    "taker": utils.DEFAULT_FEES.taker_percent_fee_decimal,
-                }
+                self._trading_fees[trading_pair] = default_fees
 
     async def _user_stream_event_listener(self):
         """
@@ -513,56 +523,63 @@ class VertexExchange(ExchangePyBase):
             trading_pair = order.trading_pair
             product_id = utils.trading_pair_to_product_id(order.trading_pair, self._exchange_market_info[self._domain])
 
-            matches_response = await self._api_post(
-                path_url=CONSTANTS.INDEXER_PATH_URL,
-                data={"matches": {"product_ids": [product_id], "subaccount": self.sender_address}},
-                limit_id=CONSTANTS.INDEXER_PATH_URL,
-            )
-
-            matches_data = matches_response.get("matches", [])
-            if matches_data is not None:
-                for trade in matches_data:
-                    # NOTE: Vertex returns all orders and matches.
-                    if trade["digest"] != order.exchange_order_id:
-                        continue
-
-                    exchange_order_id = str(trade["digest"])
-                    # NOTE: Matches can be composed of multiple trade transactions.
-                    # https://vertex-protocol.gitbook.io/docs/developer-resources/api/indexer-api/matches
-                    submission_idx = str(trade["submission_idx"])
-                    trade_fee = utils.convert_from_x18(trade["fee"])
-                    trade_amount = utils.convert_from_x18(trade["order"]["amount"])
-                    fee = TradeFeeBase.new_spot_fee(
-                        fee_schema=self.trade_fee_schema(),
-                        trade_type=TradeType.SELL if Decimal(trade_amount) < s_decimal_0 else TradeType.BUY,
-                        flat_fees=[TokenAmount(amount=Decimal(trade_fee), token="USDC")],
-                    )
-                    fill_base_amount = utils.convert_from_x18(trade["base_filled"])
-                    converted_price = utils.convert_from_x18(trade["order"]["priceX18"])
-                    fill_quote_amount = utils.convert_from_x18(trade["base_filled"])
-                    # NOTE: Matches can be composed of multiple trade transactions..
-                    matches_transactions_data = matches_response.get("txs", [])
-                    trade_timestamp = int(time.time())
-                    for transaction in matches_transactions_data:
-                        if str(transaction["submission_idx"]) != submission_idx:
-                            continue
-                        trade_timestamp = transaction["timestamp"]
-                        break
-                    trade_update = TradeUpdate(
-                        trade_id=submission_idx,
-                        client_order_id=order.client_order_id,
-                        exchange_order_id=exchange_order_id,
-                        trading_pair=trading_pair,
-                        fee=fee,
-                        fill_base_amount=abs(Decimal(fill_base_amount)),
-                        fill_quote_amount=Decimal(converted_price) * abs(Decimal(fill_quote_amount)),
-                        fill_price=Decimal(converted_price),
-                        fill_timestamp=int(trade_timestamp),
-                    )
-                    trade_updates.append(trade_update)
+            matches_by_digest, tx_timestamps = await self._get_product_matches(product_id)
+
+            for trade in matches_by_digest.get(order.exchange_order_id, []):
+                exchange_order_id = str(trade["digest"])
+                # NOTE: Matches can be composed of multiple trade transactions.
+                # https://vertex-protocol.gitbook.io/docs/developer-resources/api/indexer-api/matches
+                submission_idx = str(trade["submission_idx"])
+                trade_fee = utils.convert_from_x18(trade["fee"])
+                trade_amount = utils.convert_from_x18(trade["order"]["amount"])
+                fee = TradeFeeBase.new_spot_fee(
+                    fee_schema=self.trade_fee_schema(),
+                    trade_type=TradeType.SELL if Decimal(trade_amount) < s_decimal_0 else TradeType.BUY,
+                    flat_fees=[TokenAmount(amount=Decimal(trade_fee), token="USDC")],
+                )
+                fill_base_amount = utils.convert_from_x18(trade["base_filled"])
+                converted_price = utils.convert_from_x18(trade["order"]["priceX18"])
+                fill_quote_amount = utils.convert_from_x18(trade["base_filled"])
+                trade_timestamp = tx_timestamps.get(submission_idx, int(time.time()))
+                trade_update = TradeUpdate(
+                    trade_id=submission_idx,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=exchange_order_id,
+                    trading_pair=trading_pair,
+                    fee=fee,
+                    fill_base_amount=abs(Decimal(fill_base_amount)),
+                    fill_quote_amount=Decimal(converted_price) * abs(Decimal(fill_quote_amount)),
+                    fill_price=Decimal(converted_price),
+                    fill_timestamp=int(trade_timestamp),
+                )
+                trade_updates.append(trade_update)
 
         return trade_updates
 
+    async def _get_product_matches(self, product_id: int) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any]]:
+        """
+        Returns the product's matches grouped by order digest, and the timestamp of each submission index.
+        """
+        # NOTE: The indexer returns every match of the subaccount for the product, so orders on the same product
+        # share one response within a tick instead of each requesting the same page
+        timestamp = self.current_timestamp
+        cached = self._matches_by_product.get(product_id)
+        if cached is not None and cached[0] == timestamp:
+            return cached[1]
+        matches_response = await self._api_post(
+            path_url=CONSTANTS.INDEXER_PATH_URL,
+            data={"matches": {"product_ids": [product_id], "subaccount": self.sender_address}},
+            limit_id=CONSTANTS.INDEXER_PATH_URL,
+        )
+        matches_by_digest: Dict[str, List[Dict[str, Any]]] = {}
+        for trade in matches_response.get("matches") or []:
+            matches_by_digest.setdefault(trade["digest"], []).append(trade)
+        tx_timestamps: Dict[str, Any] = {}
+        for transaction in matches_response.get("txs") or []:
+            tx_timestamps.setdefault(str(transaction["submission_idx"]), transaction["timestamp"])
+        self._matches_by_product[product_id] = (timestamp, (matches_by_digest, tx_timestamps))
+        return matches_by_digest, tx_timestamps
+
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         """
         This requests the order from the live squencer, then if it cannot locate it, it attempts to locate it with the indexer
@@ -676,9 +693,11 @@ class VertexExchange(ExchangePyBase):
             del self._account_balances[asset_name]
 
     async def build_exchange_market_info(self):
-        exchange_info = await self._api_get(path_url=self.trading_pairs_request_path)
-        symbol_map = await self._get_symbols()
-        contract_info = await self._get_contracts()
+        exchange_info, symbol_map, contract_info = await safe_gather(
+            self._api_get(path_url=self.trading_pairs_request_path),
+            self._get_symbols(),
+            self._get_contracts(),
+        )
         self._exchange_market_info[self._domain] = {}
 
         symbol_data = {}
@@ -718,8 +737,7 @@ class VertexExchange(ExchangePyBase):
             # NOTE: USDC is an asset, however it doesn't have a "market"
             if product_id == 0:
                 continue
-            base = trading_pair.split("/")[0]
-            quote = trading_pair.split("/")[1]
+            base, quote = trading_pair.split("/")[:2]
             mapping[trading_pair] = combine_to_hb_trading_pair(base=base, quote=quote)
         self._set_trading_pair_symbol_map(mapping)
 
@@ -787,48 +805,40 @@ class VertexExchange(ExchangePyBase):
         return response
 
     async def _get_account_max_withdrawable(self):
-        sender_address = self.sender_address
-        available_balances = {}
         trading_pairs = self._trading_pairs
 
+        if len(self._trading_pairs) == 0:
+            trading_pairs = [
+                product_info["market"]
+                for product_id, product_info in self._exchange_market_info[self._domain].items()
+                if product_id != 0
+            ]
+        product_ids = [0] + [
+            utils.trading_pair_to_product_id(
+                trading_pair=trading_pair, exchange_market_info=self._exchange_market_info[self._domain]
+            )
+            for trading_pair in trading_pairs
+        ]
+        max_withdrawables = await safe_gather(
+            *[self._get_product_max_withdrawable(product_id=product_id) for product_id in product_ids]
+        )
+
+        return {product_id: max_withdrawable for product_id, max_withdrawable in zip(product_ids, max_withdrawables)}
+
+    async def _get_product_max_withdrawable(self, product_id: int) -> Decimal:
+        sender_address = self.sender_address
         params = {
             "type": CONSTANTS.MAX_WITHDRAWABLE_REQUEST_TYPE,
-            "product_id": 0,
+            "product_id": product_id,
             "sender": sender_address,
             "spot_leverage": str(self._use_spot_leverage).lower(),
         }
         response = await self._api_get(path_url=CONSTANTS.QUERY_PATH_URL, params=params)
 
         if response is None or "failure" in response["status"] or "data" not in response:
-            raise IOError(f"Unable to get available balance of product {0} for {sender_address}")
-
-        available_balances.update({0: Decimal(utils.convert_from_x18(response["data"]["max_withdrawable"]))})
-
-        if len(self._trading_pairs) == 0:
-            trading_pairs = []
-            for product_id in self._exchange_market_info[self._domain]:
-                if product_id != 0:
-                    trading_pairs.append(self._exchange_market_info[self._domain][product_id]["market"])
-        for trading_pair in trading_pairs:
-            product_id = utils.trading_pair_to_product_id(
-                trading_pair=trading_pair, exchange_market_info=self._exchange_market_info[self._domain]
-            )
-            params = {
-                "type": CONSTANTS.MAX_WITHDRAWABLE_REQUEST_TYPE,
-                "product_id": product_id,
-                "sender": sender_address,
-                "spot_leverage": str(self._use_spot_leverage).lower(),
-            }
-            response = await self._api_get(path_url=CONSTANTS.QUERY_PATH_URL, params=params)
-
-            if response is None or "failure" in response["status"] or "data" not in response:
-                raise IOError(f"Unable to get available balance of product {product_id} for {sender_address}")
-
-            available_balances.update(
-                {product_id: Decimal(utils.convert_from_x18(response["data"]["max_withdrawable"]))}
-            )
+            raise IOError(f"Unable to get available balance of product {product_id} for {sender_address}")
 
-        return available_balances
+        return Decimal(utils.convert_from_x18(response["data"]["max_withdrawable"]))
 
     async def _get_contracts(self):
         response = await self._api_get(
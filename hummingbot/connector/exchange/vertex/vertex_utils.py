@@ -17,6 +17,8 @@ DEFAULT_FEES = TradeFeeSchema(
     taker_percent_fee_decimal=Decimal("0.0002"),
 )
 
+X18_DECIMAL = Decimal("1000000000000000000")
+
 
 def hex_to_bytes32(hex_string: str) -> bytes:
     if hex_string.startswith("0x"):
@@ -55,7 +57,7 @@ def convert_from_x18(data: Any, precision: Optional[Decimal] = None) -> Any:
 
     # Check if data type is str or float
     if isinstance(data, str) or isinstance(data, numbers.Number):
-        data = Decimal(data) / Decimal("1000000000000000000")  # type: ignore
+        data = Decimal(data) / X18_DECIMAL  # type: ignore
         if precision:
             data = data.quantize(precision)
         return str(data)
@@ -84,7 +86,7 @@ def convert_to_x18(data: Any, precision: Optional[Decimal] = None) -> Any:
         data = Decimal(str(data))  # type: ignore
         if precision:
             data = data.quantize(precision)
-        return str((data * Decimal("1000000000000000000")).quantize(Decimal("1")))
+        return str((data * X18_DECIMAL).quantize(Decimal("1")))
 
     if isinstance(data, dict):
         for k, v in data.items():
@@ -37,6 +37,8 @@ ORDER_STATE = {
     "canceled": OrderState.CANCELED,
     "rejected": OrderState.FAILED,
 }
+FILLED_ORDER_STATES = frozenset([OrderState.FILLED, OrderState.PARTIALLY_FILLED])
+FINAL_ORDER_STATES = frozenset([OrderState.FILLED, OrderState.CANCELED, OrderState.FAILED])
 
 # Order Types
 XRPL_ORDER_TYPE = {
@@ -65,6 +67,11 @@ LEDGER_OFFSET = _LEDGER_OFFSET * 2
 # Timeout for pending order status check
 PENDING_ORDER_STATUS_CHECK_TIMEOUT = 120
 
+# Per-order last status update timestamps. Entries only matter for the minimum update interval (0.5s), so they
+# expire after a minute; the size bound caps memory for orders that never reach a final state
+ORDER_LAST_UPDATE_CACHE_MAX_SIZE = 10000
+ORDER_LAST_UPDATE_CACHE_TTL = 60
+
 # Request Timeout
 REQUEST_TIMEOUT = 60
 
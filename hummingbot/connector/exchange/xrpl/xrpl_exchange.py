@@ -7,6 +7,7 @@ from decimal import ROUND_DOWN, Decimal
 from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from bidict import bidict
+from cachetools import TTLCache
 
 # XRPL Imports
 from xrpl.asyncio.clients import AsyncWebsocketClient, Client, XRPLRequestFailureException
@@ -119,8 +120,11 @@ class XrplExchange(ExchangePyBase):
         self._order_status_locks: Dict[str, asyncio.Lock] = {}
         self._order_status_lock_manager_lock = asyncio.Lock()
 
-        # Timing safeguards to prevent rapid consecutive updates
-        self._order_last_update_timestamps: Dict[str, float] = {}
+        # Timing safeguards to prevent rapid consecutive updates. Entries older than the minimum interval behave as
+        # missing ones, so they expire on their own instead of piling up for orders that never reach a final state
+        self._order_last_update_timestamps: TTLCache = TTLCache(
+            maxsize=CONSTANTS.ORDER_LAST_UPDATE_CACHE_MAX_SIZE, ttl=CONSTANTS.ORDER_LAST_UPDATE_CACHE_TTL
+        )
         self._min_update_interval_seconds = 0.5  # Minimum time between status updates for same order
 
         super().__init__(balance_asset_limit, rate_limits_share_pct)
@@ -319,7 +323,7 @@ class XrplExchange(ExchangePyBase):
         # XRPL-specific cleanup
         await self._cleanup_order_status_lock(tracked_order.client_order_id)
 
-        self.logger().info(f"Order {tracked_order.client_order_id} reached final state: {new_state.name}")
+        self.logger().info("Order %s reached final state: %s", tracked_order.client_order_id, new_state.name)
 
     async def _process_market_order_transaction(self, tracked_order: InFlightOrder, transaction: Dict, meta: Dict, event_message: Dict):
         """
@@ -359,7 +363,7 @@ class XrplExchange(ExchangePyBase):
             update_timestamp = time.time()
             trade_update = None
 
-            if new_order_state in [OrderState.FILLED, OrderState.PARTIALLY_FILLED]:
+            if new_order_state in CONSTANTS.FILLED_ORDER_STATES:
                 trade_update = await self.process_trade_fills(event_message, tracked_order)
                 if trade_update is None:
                     self.logger().error(
@@ -497,7 +501,7 @@ class XrplExchange(ExchangePyBase):
                     # Record the update timestamp
                     self._record_order_status_update(tracked_order.client_order_id)
 
-                    if new_order_state in [OrderState.FILLED, OrderState.PARTIALLY_FILLED]:
+                    if new_order_state in CONSTANTS.FILLED_ORDER_STATES:
                         trade_update = await self.process_trade_fills(event_message, tracked_order)
                         if trade_update is None:
                             self.logger().error(
@@ -505,7 +509,7 @@ class XrplExchange(ExchangePyBase):
                             )
 
                     # Process final state using centralized method (handles stop_tracking_order)
-                    if new_order_state in [OrderState.FILLED, OrderState.CANCELED, OrderState.FAILED]:
+                    if new_order_state in CONSTANTS.FINAL_ORDER_STATES:
                         await self._process_final_order_state(tracked_order, new_order_state, update_timestamp, trade_update)
                     else:
                         # For non-final states, use regular order update
@@ -592,9 +596,15 @@ class XrplExchange(ExchangePyBase):
                     submit_data = {"transaction": signed_tx, "prelim_result": prelim_result}
 
                     self.logger().info(
-                        f"Submitted order {order_id} ({o_id}): type={order_type}, "
-                        f"pair={trading_pair}, amount={amount}, price={price}, "
-                        f"prelim_result={prelim_result}, tx_hash={submit_response.result.get('tx_json', {}).get('hash', 'unknown')}"
+                        "Submitted order %s (%s): type=%s, pair=%s, amount=%s, price=%s, prelim_result=%s, tx_hash=%s",
+                        order_id,
+                        o_id,
+                        order_type,
+                        trading_pair,
+                        amount,
+                        price,
+                        prelim_result,
+                        submit_response.result.get("tx_json", {}).get("hash", "unknown"),
                     )
 
                 order_update: OrderUpdate = OrderUpdate(
@@ -623,9 +633,13 @@ class XrplExchange(ExchangePyBase):
                 else:
                     retry += 1
                     self.logger().info(
-                        f"Order {order_id} ({o_id}) placing failed with result {prelim_result}. "
-                        f"Retrying in {CONSTANTS.PLACE_ORDER_RETRY_INTERVAL} seconds... "
-                        f"(Attempt {retry}/{CONSTANTS.PLACE_ORDER_MAX_RETRY})"
+                        "Order %s (%s) placing failed with result %s. Retrying in %s seconds... (Attempt %s/%s)",
+                        order_id,
+                        o_id,
+                        prelim_result,
+                        CONSTANTS.PLACE_ORDER_RETRY_INTERVAL,
+                        retry,
+                        CONSTANTS.PLACE_ORDER_MAX_RETRY,
                     )
                     await self._sleep(CONSTANTS.PLACE_ORDER_RETRY_INTERVAL)
 
@@ -682,7 +696,7 @@ class XrplExchange(ExchangePyBase):
 
         self._order_tracker.process_order_update(order_update)
 
-        if order_update.new_state in [OrderState.FILLED, OrderState.PARTIALLY_FILLED]:
+        if order_update.new_state in CONSTANTS.FILLED_ORDER_STATES:
             trade_update = await self.process_trade_fills(
                 order_creation_resp.to_dict() if order_creation_resp is not None else None, order
             )
@@ -795,8 +809,11 @@ class XrplExchange(ExchangePyBase):
                 prelim_result = submit_response.result["engine_result"]
 
                 self.logger().info(
-                    f"Submitted cancel for order {order_id} ({exchange_order_id}): "
-                    f"prelim_result={prelim_result}, tx_hash={submit_response.result.get('tx_json', {}).get('hash', 'unknown')}"
+                    "Submitted cancel for order %s (%s): prelim_result=%s, tx_hash=%s",
+                    order_id,
+                    exchange_order_id,
+                    prelim_result,
+                    submit_response.result.get("tx_json", {}).get("hash", "unknown"),
                 )
 
             if prelim_result is None:
@@ -825,8 +842,12 @@ class XrplExchange(ExchangePyBase):
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         # Early exit if order is not being tracked and is already in a final state
         is_actively_tracked = order.client_order_id in self._order_tracker.active_orders
-        if not is_actively_tracked and order.current_state in [OrderState.FILLED, OrderState.CANCELED, OrderState.FAILED]:
-            self.logger().debug(f"Order {order.client_order_id} is not being tracked and already in final state {order.current_state}, cancellation not needed")
+        if not is_actively_tracked and order.current_state in CONSTANTS.FINAL_ORDER_STATES:
+            self.logger().debug(
+                "Order %s is not being tracked and already in final state %s, cancellation not needed",
+                order.client_order_id,
+                order.current_state,
+            )
             return order.current_state == OrderState.CANCELED
 
         # Use order-specific lock to prevent concurrent status updates
@@ -838,21 +859,19 @@ class XrplExchange(ExchangePyBase):
                     await self._sleep(3)
 
                 # Double-check if order state changed after acquiring lock
-                if not is_actively_tracked and order.current_state in [
-                    OrderState.FILLED,
-                    OrderState.CANCELED,
-                    OrderState.FAILED,
-                ]:
+                if not is_actively_tracked and order.current_state in CONSTANTS.FINAL_ORDER_STATES:
                     self.logger().debug(
-                        f"Order {order.client_order_id} is no longer being tracked after acquiring lock and in final state {order.current_state}, cancellation not needed"
+                        "Order %s is no longer being tracked after acquiring lock and in final state %s, cancellation not needed",
+                        order.client_order_id,
+                        order.current_state,
                     )
                     return order.current_state == OrderState.CANCELED
 
                 # Check current order state before attempting cancellation
                 current_state = order.current_state
-                if current_state in [OrderState.FILLED, OrderState.CANCELED, OrderState.FAILED]:
+                if current_state in CONSTANTS.FINAL_ORDER_STATES:
                     self.logger().debug(
-                        f"Order {order.client_order_id} is already in final state {current_state}, skipping cancellation"
+                        "Order %s is already in final state %s, skipping cancellation", order.client_order_id, current_state
                     )
                     return current_state == OrderState.CANCELED
 
@@ -880,9 +899,11 @@ class XrplExchange(ExchangePyBase):
                     fresh_order_update = await self._request_order_status(order)
 
                     # If order is filled/partially filled, process the fills and don't cancel
-                    if fresh_order_update.new_state in [OrderState.FILLED, OrderState.PARTIALLY_FILLED]:
+                    if fresh_order_update.new_state in CONSTANTS.FILLED_ORDER_STATES:
                         self.logger().debug(
-                            f"Order {order.client_order_id} is {fresh_order_update.new_state.name}, processing fills instead of canceling"
+                            "Order %s is %s, processing fills instead of canceling",
+                            order.client_order_id,
+                            fresh_order_update.new_state.name,
                         )
 
                         trade_updates = await self._all_trade_updates_for_order(order)
@@ -906,7 +927,7 @@ class XrplExchange(ExchangePyBase):
 
                     # If order is already canceled, return success
                     elif fresh_order_update.new_state == OrderState.CANCELED:
-                        self.logger().debug(f"Order {order.client_order_id} already canceled")
+                        self.logger().debug("Order %s already canceled", order.client_order_id)
                         # Use centralized final state processing for already cancelled orders
                         await self._process_final_order_state(
                             order, OrderState.CANCELED, fresh_order_update.update_timestamp
@@ -928,7 +949,7 @@ class XrplExchange(ExchangePyBase):
                     else:
                         retry += 1
                         self.logger().info(
-                            f"Order cancellation failed. Retrying in {CONSTANTS.CANCEL_RETRY_INTERVAL} seconds..."
+                            "Order cancellation failed. Retrying in %s seconds...", CONSTANTS.CANCEL_RETRY_INTERVAL
                         )
                         await self._sleep(CONSTANTS.CANCEL_RETRY_INTERVAL)
 
@@ -968,8 +989,9 @@ class XrplExchange(ExchangePyBase):
                     if status == "cancelled":
                         # Enhanced logging for debugging race conditions
                         self.logger().debug(
-                            f"[CANCELLATION] Order {order.client_order_id} successfully canceled "
-                            f"(previous state: {order.current_state.name})"
+                            "[CANCELLATION] Order %s successfully canceled (previous state: %s)",
+                            order.client_order_id,
+                            order.current_state.name,
                         )
 
                         # Use centralized final state processing for successful cancellation
@@ -982,8 +1004,11 @@ class XrplExchange(ExchangePyBase):
                             if final_status_check.new_state == OrderState.FILLED:
                                 # Enhanced logging for debugging race conditions
                                 self.logger().debug(
-                                    f"[CANCELLATION_RACE_CONDITION] Order {order.client_order_id} was filled during cancellation attempt "
-                                    f"(previous state: {order.current_state.name} -> {final_status_check.new_state.name})"
+                                    "[CANCELLATION_RACE_CONDITION] Order %s was filled during cancellation attempt "
+                                    "(previous state: %s -> %s)",
+                                    order.client_order_id,
+                                    order.current_state.name,
+                                    final_status_check.new_state.name,
                                 )
                                 trade_updates = await self._all_trade_updates_for_order(order)
                                 first_trade_update = trade_updates[0] if len(trade_updates) > 0 else None
@@ -1378,7 +1403,7 @@ class XrplExchange(ExchangePyBase):
                             continue
 
                         if int(change.get("sequence")) == int(sequence):
-                            self.logger().debug(f"Processing offer change with sequence {sequence}")
+                            self.logger().debug("Processing offer change with sequence %s", sequence)
                             taker_gets = change.get("taker_gets")
                             taker_pays = change.get("taker_pays")
 
@@ -1400,7 +1425,7 @@ class XrplExchange(ExchangePyBase):
                                 continue
 
                             self.logger().debug(
-                                f"Original tx_taker_gets: {tx_taker_gets}, tx_taker_pays: {tx_taker_pays}"
+                                "Original tx_taker_gets: %s, tx_taker_pays: %s", tx_taker_gets, tx_taker_pays
                             )
                             if isinstance(tx_taker_gets, str):
                                 tx_taker_gets = {"currency": "XRP", "value": str(drops_to_xrp(tx_taker_gets))}
@@ -1408,7 +1433,7 @@ class XrplExchange(ExchangePyBase):
                             if isinstance(tx_taker_pays, str):
                                 tx_taker_pays = {"currency": "XRP", "value": str(drops_to_xrp(tx_taker_pays))}
                             self.logger().debug(
-                                f"Processed tx_taker_gets: {tx_taker_gets}, tx_taker_pays: {tx_taker_pays}"
+                                "Processed tx_taker_gets: %s, tx_taker_pays: %s", tx_taker_gets, tx_taker_pays
                             )
 
                             # Check if values exist before comparing
@@ -1418,8 +1443,11 @@ class XrplExchange(ExchangePyBase):
                             tx_taker_pays_value = tx_taker_pays.get("value", "0")
 
                             self.logger().debug(
-                                f"Comparing values - taker_gets: {taker_gets_value}, tx_taker_gets: {tx_taker_gets_value}, "
-                                f"taker_pays: {taker_pays_value}, tx_taker_pays: {tx_taker_pays_value}"
+                                "Comparing values - taker_gets: %s, tx_taker_gets: %s, taker_pays: %s, tx_taker_pays: %s",
+                                taker_gets_value,
+                                tx_taker_gets_value,
+                                taker_pays_value,
+                                tx_taker_pays_value,
                             )
 
                             if (
@@ -1453,7 +1481,7 @@ class XrplExchange(ExchangePyBase):
                                     diff_taker_gets_value = abs(taker_gets_decimal - tx_taker_gets_decimal)
                                     diff_taker_pays_value = abs(taker_pays_decimal - tx_taker_pays_decimal)
                                     self.logger().debug(
-                                        f"Calculated diffs - gets: {diff_taker_gets_value}, pays: {diff_taker_pays_value}"
+                                        "Calculated diffs - gets: %s, pays: %s", diff_taker_gets_value, diff_taker_pays_value
                                     )
 
                                     diff_taker_gets = Balance(
@@ -1467,7 +1495,9 @@ class XrplExchange(ExchangePyBase):
                                     )
 
                                     self.logger().debug(
-                                        f"Looking for base currency: {base_currency.currency}, quote currency: {quote_currency.currency}"
+                                        "Looking for base currency: %s, quote currency: %s",
+                                        base_currency.currency,
+                                        quote_currency.currency,
                                     )
                                     base_change = get_token_from_changes(
                                         token_changes=[diff_taker_gets, diff_taker_pays], token=base_currency.currency
@@ -1475,9 +1505,7 @@ class XrplExchange(ExchangePyBase):
                                     quote_change = get_token_from_changes(
                                         token_changes=[diff_taker_gets, diff_taker_pays], token=quote_currency.currency
                                     )
-                                    self.logger().debug(
-                                        f"Found base_change: {base_change}, quote_change: {quote_change}"
-                                    )
+                                    self.logger().debug("Found base_change: %s, quote_change: %s", base_change, quote_change)
 
                                     # Validate base_change and quote_change
                                     if base_change is None or quote_change is None:
@@ -1496,7 +1524,7 @@ class XrplExchange(ExchangePyBase):
                                     if order.order_type == OrderType.AMM_SWAP:
                                         fee_rate = fee_rules.get("amm_pool_fee")
 
-                                    self.logger().debug(f"Fee details - token: {fee_token}, rate: {fee_rate}")
+                                    self.logger().debug("Fee details - token: %s, rate: %s", fee_token, fee_rate)
 
                                     # Validate fee_token and fee_rate
                                     if fee_token is None or fee_rate is None:
@@ -1707,8 +1735,8 @@ class XrplExchange(ExchangePyBase):
             if current_state is OrderState.PENDING_CREATE or current_state is OrderState.PENDING_CANCEL:
                 if time.time() - tracked_order.last_update_timestamp > CONSTANTS.PENDING_ORDER_STATUS_CHECK_TIMEOUT:
                     new_order_state = OrderState.FAILED
-                    self.logger().info(f"History transactions: {history_transactions}")
-                    self.logger().info(f"Creation tx resp: {creation_tx_resp}")
+                    self.logger().debug("History transactions: %s", history_transactions)
+                    self.logger().debug("Creation tx resp: %s", creation_tx_resp)
                     self.logger().error(
                         f"Order status not found for order {tracked_order.client_order_id} ({sequence}), tx history: {transactions}"
                     )
@@ -1809,7 +1837,7 @@ class XrplExchange(ExchangePyBase):
             try:
                 async with order_lock:
                     # Skip if order is already in final state to prevent unnecessary updates
-                    if order.current_state in [OrderState.FILLED, OrderState.CANCELED, OrderState.FAILED]:
+                    if order.current_state in CONSTANTS.FINAL_ORDER_STATES:
                         if order.current_state == OrderState.FILLED:
                             order.completely_filled_event.set()
                             # Clean up lock for completed order
@@ -1846,7 +1874,7 @@ class XrplExchange(ExchangePyBase):
                         # Record the update timestamp
                         self._record_order_status_update(order.client_order_id)
 
-                        if order_update.new_state in [OrderState.FILLED, OrderState.PARTIALLY_FILLED]:
+                        if order_update.new_state in CONSTANTS.FILLED_ORDER_STATES:
                             trade_updates = await self._all_trade_updates_for_order(order)
                             if len(trade_updates) > 0:
                                 for trade_update in trade_updates:
@@ -145,10 +145,13 @@ class XRPLMarket(BaseModel):
         if self.trading_pair_symbol is None:
             return None
 
-        if code.upper() == self.base.upper() and issuer.upper() == self.base_issuer.upper():
+        code = code.upper()
+        issuer = issuer.upper()
+
+        if code == self.base.upper() and issuer == self.base_issuer.upper():
             return self.trading_pair_symbol.split("-")[0]
 
-        if code.upper() == self.quote.upper() and issuer.upper() == self.quote_issuer.upper():
+        if code == self.quote.upper() and issuer == self.quote_issuer.upper():
             return self.trading_pair_symbol.split("-")[1]
 
         return None
@@ -271,23 +274,31 @@ async def get_latest_validated_ledger_sequence(client: Client) -> int:
     raise XRPLRequestFailureException(response.result)
 
 
-_LEDGER_CLOSE_TIME: Final[int] = 1
+_FINAL_OUTCOME_INITIAL_POLL_DELAY: Final[float] = 0.25
+_FINAL_OUTCOME_MAX_POLL_DELAY: Final[float] = 2.0
 
 
-async def _sleep(seconds: int):
+async def _sleep(seconds: float):
     await asyncio.sleep(seconds)
 
 
 async def _wait_for_final_transaction_outcome(
-    transaction_hash: str, client: Client, prelim_result: str, last_ledger_sequence: int
+    transaction_hash: str,
+    client: Client,
+    prelim_result: str,
+    last_ledger_sequence: int,
+    poll_delay: float = _FINAL_OUTCOME_INITIAL_POLL_DELAY,
 ) -> Response:
     """
     The core logic of reliable submission.  Polls the ledger until the result of the
     transaction can be considered final, meaning it has either been included in a
     validated ledger, or the transaction's LastLedgerSequence has been surpassed by the
     latest ledger sequence (meaning it will never be included in a validated ledger).
+    The delay between polls starts short and doubles on every attempt up to a maximum,
+    so quick validations are seen early without querying the node every second afterwards.
     """
-    await _sleep(_LEDGER_CLOSE_TIME)
+    await _sleep(poll_delay)
+    next_poll_delay = min(poll_delay * 2, _FINAL_OUTCOME_MAX_POLL_DELAY)
 
     current_ledger_sequence = await get_latest_validated_ledger_sequence(client)
 
@@ -306,7 +317,7 @@ async def _wait_for_final_transaction_outcome(
             in queue and not processed on the ledger yet.
             """
             return await _wait_for_final_transaction_outcome(
-                transaction_hash, client, prelim_result, last_ledger_sequence
+                transaction_hash, client, prelim_result, last_ledger_sequence, next_poll_delay
             )
         else:
             raise XRPLRequestFailureException(transaction_response.result)
@@ -320,7 +331,9 @@ async def _wait_for_final_transaction_outcome(
         return transaction_response
 
     # outcome is not yet final
-    return await _wait_for_final_transaction_outcome(transaction_hash, client, prelim_result, last_ledger_sequence)
+    return await _wait_for_final_transaction_outcome(
+        transaction_hash, client, prelim_result, last_ledger_sequence, next_poll_delay
+    )
 
 
 # AMM Interfaces
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import Dict, List, Iterator, Mapping, Optional
+from typing import Dict, List, Iterator, Mapping, Optional, Tuple
 
 from bidict import bidict
 
@@ -35,6 +35,7 @@ cdef class ExchangeBase(ConnectorBase):
         self._budget_checker = BudgetChecker(exchange=self)
         self._trading_pair_symbol_map: Optional[Mapping[str, str]] = None
         self._mapping_initialization_lock = asyncio.Lock()
+        self._last_trade_price_cache: Dict[str, Tuple[float, Decimal]] = {}
 
     @staticmethod
     def convert_from_exchange_trading_pair(exchange_trading_pair: str) -> Optional[str]:
@@ -349,7 +350,14 @@ cdef class ExchangeBase(ConnectorBase):
         elif price_type is PriceType.MidPrice:
             return (self.c_get_price(trading_pair, True) + self.c_get_price(trading_pair, False)) / Decimal("2")
         elif price_type is PriceType.LastTrade:
-            return Decimal(self.c_get_order_book(trading_pair).last_trade_price)
+            # The last trade price only changes when a trade arrives, so the Decimal conversion is reused while the
+            # order book keeps reporting the same float value
+            last_trade_price = self.c_get_order_book(trading_pair).last_trade_price
+            cached = self._last_trade_price_cache.get(trading_pair)
+            if cached is None or cached[0] != last_trade_price:
+                cached = (last_trade_price, Decimal(last_trade_price))
+                self._last_trade_price_cache[trading_pair] = cached
+            return cached[1]
 
     async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
         """
@@ -35,6 +35,9 @@ class GatewayBase(ConnectorBase):
 
     API_CALL_TIMEOUT = 10.0
     POLL_INTERVAL = 1.0
+    TRANSACTION_MONITOR_INITIAL_INTERVAL = 0.25
+    TRANSACTION_MONITOR_BACKOFF_FACTOR = 1.6
+    TRANSACTION_MONITOR_TIMEOUT = 60.0
     UPDATE_BALANCE_INTERVAL = 30.0
     APPROVAL_ORDER_ID_PATTERN = re.compile(r"approve-(\w+)-(\w+)")
 
@@ -58,6 +61,7 @@ class GatewayBase(ConnectorBase):
     _order_tracker: ClientOrderTracker
     _native_currency: str
     _amount_quantum_dict: Dict[str, Decimal]
+    _order_size_quantum_by_pair: Dict[str, Decimal]
 
     def __init__(self,
                  connector_name: str,
@@ -104,7 +108,9 @@ class GatewayBase(ConnectorBase):
         self._native_currency = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
         self._amount_quantum_dict = {}
+        self._order_size_quantum_by_pair = {}
         self._token_data = {}  # Store complete token information
+        self._token_data_by_address = {}  # Same token information keyed by lowercased address
         self._allowances = {}
 
     @classmethod
@@ -281,6 +287,12 @@ class GatewayBase(ConnectorBase):
             self._amount_quantum_dict[symbol] = Decimal(str(10 ** -t["decimals"]))
             # Store complete token data for easy access
             self._token_data[symbol] = t
+        self._order_size_quantum_by_pair = {}
+        self._token_data_by_address = {}
+        for token_data in self._token_data.values():
+            address = (token_data.get("address") or "").lower()
+            if address:
+                self._token_data_by_address.setdefault(address, token_data)
 
     def get_taker_order_type(self):
         return OrderType.LIMIT
@@ -289,8 +301,12 @@ class GatewayBase(ConnectorBase):
         return Decimal("1e-15")
 
     def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
-        base, quote = trading_pair.split("-")
-        return max(self._amount_quantum_dict[base], self._amount_quantum_dict[quote])
+        quantum = self._order_size_quantum_by_pair.get(trading_pair)
+        if quantum is None:
+            base, quote = trading_pair.split("-")
+            quantum = max(self._amount_quantum_dict[base], self._amount_quantum_dict[quote])
+            self._order_size_quantum_by_pair[trading_pair] = quantum
+        return quantum
 
     def get_token_info(self, token_symbol: str) -> Optional[Dict[str, Any]]:
         """Get token information for a given symbol."""
@@ -298,11 +314,7 @@ class GatewayBase(ConnectorBase):
 
     def get_token_by_address(self, token_address: str) -> Optional[Dict[str, Any]]:
         """Get token information for a given address."""
-        # Search through all tokens to find matching address
-        for symbol, token_data in self._token_data.items():
-            if token_data.get("address", "").lower() == token_address.lower():
-                return token_data
-        return None
+        return self._token_data_by_address.get(token_address.lower())
 
     async def get_chain_info(self):
         """
@@ -440,8 +452,9 @@ class GatewayBase(ConnectorBase):
                 token_symbols=token_list
             )
             for token, bal in resp_json["balances"].items():
-                self._account_available_balances[token] = Decimal(str(bal))
-                self._account_balances[token] = Decimal(str(bal))
+                balance = Decimal(str(bal))
+                self._account_available_balances[token] = balance
+                self._account_balances[token] = balance
                 remote_asset_names.add(token)
             asset_names_to_remove = local_asset_names.difference(remote_asset_names)
             for asset_name in asset_names_to_remove:
@@ -653,16 +666,20 @@ class GatewayBase(ConnectorBase):
         """
         Monitor a specific transaction status until it's confirmed or failed.
         This is useful for quick transactions that complete before the regular polling interval.
+        The wait between checks starts at TRANSACTION_MONITOR_INITIAL_INTERVAL and grows by
+        TRANSACTION_MONITOR_BACKOFF_FACTOR up to check_interval, so fast confirmations are detected early. Monitoring
+        stops once TRANSACTION_MONITOR_TIMEOUT seconds have elapsed, including the time spent on the status requests.
         """
         tracked_order = self._order_tracker.fetch_order(order_id)
         if not tracked_order:
             self.logger().warning(f"Order {order_id} not found in tracker, cannot monitor transaction status")
             return
 
-        max_attempts = 30  # Maximum 60 seconds of monitoring
-        attempts = 0
+        deadline = time.monotonic() + self.TRANSACTION_MONITOR_TIMEOUT
+        delay = min(self.TRANSACTION_MONITOR_INITIAL_INTERVAL, check_interval)
 
-        while attempts < max_attempts and tracked_order.current_state not in [OrderState.FILLED, OrderState.FAILED, OrderState.CANCELED]:
+        while (time.monotonic() < deadline
+               and tracked_order.current_state not in [OrderState.FILLED, OrderState.FAILED, OrderState.CANCELED]):
             try:
                 tx_details = await self._get_gateway_instance().get_transaction_status(
                     self.chain,
@@ -689,7 +706,7 @@ class GatewayBase(ConnectorBase):
                     )
                     self._order_tracker.process_order_update(order_update)
 
-                    self.logger().info(f"Transaction {transaction_hash} confirmed for order {order_id}")
+                    self.logger().info("Transaction %s confirmed for order %s", transaction_hash, order_id)
                     break
 
                 # Transaction failed
@@ -705,14 +722,15 @@ class GatewayBase(ConnectorBase):
                     break
 
                 # Still pending, wait and try again
-                await asyncio.sleep(check_interval)
-                attempts += 1
+                await asyncio.sleep(delay)
+                delay = min(delay * self.TRANSACTION_MONITOR_BACKOFF_FACTOR, check_interval)
 
             except Exception as e:
                 self.logger().error(f"Error monitoring transaction status for {order_id}: {str(e)}", exc_info=True)
                 break
 
-        if attempts >= max_attempts:
+        if (time.monotonic() >= deadline
+                and tracked_order.current_state not in [OrderState.FILLED, OrderState.FAILED, OrderState.CANCELED]):
             self.logger().warning(f"Transaction monitoring timed out for order {order_id}, transaction {transaction_hash}")
 
     def get_balance(self, currency: str) -> Decimal:
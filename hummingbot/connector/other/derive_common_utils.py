@@ -1,12 +1,32 @@
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 
-from eth_abi.abi import encode
+from eth_abi.registry import registry
+from eth_account.signers.local import LocalAccount
 from hexbytes import HexBytes
 from web3 import Account, Web3
 
 from hummingbot.connector.derivative.derive_perpetual.derive_perpetual_web_utils import decimal_to_big_int
 
+# Built once so signing an order does not resolve the same ABI type strings on every call
+_TRADE_MODULE_DATA_ENCODER = registry.get_tuple_encoder("address", "uint", "int", "int", "uint", "uint", "bool")
+_ACTION_ENCODER = registry.get_tuple_encoder(
+    "bytes32", "uint", "uint", "address", "bytes32", "uint", "address", "address"
+)
+
+
+@lru_cache(maxsize=256)
+def to_checksum_address(address: str) -> str:
+    # The module, asset, owner and signer addresses repeat on every order, so each one is only hashed once
+    return Web3.to_checksum_address(address)
+
+
+@lru_cache(maxsize=8)
+def _bytes_from_hex(value: str) -> bytes:
+    # The domain separator and action typehash are protocol constants, decoded once instead of on every signature
+    return bytes.fromhex(value[2:])
+
 
 @dataclass
 class ModuleData:
@@ -28,17 +48,16 @@ class TradeModuleData(ModuleData):
     is_bid: bool
 
     def to_abi_encoded(self):
-        return encode(
-            ["address", "uint", "int", "int", "uint", "uint", "bool"],
-            [
-                Web3.to_checksum_address(self.asset_address),
+        return _TRADE_MODULE_DATA_ENCODER(
+            (
+                to_checksum_address(self.asset_address),
                 self.sub_id,
                 decimal_to_big_int(self.limit_price),
                 decimal_to_big_int(self.amount),
                 decimal_to_big_int(self.max_fee),
                 self.recipient_id,
                 self.is_bid,
-            ],
+            )
         )
 
     def to_json(self):
@@ -77,7 +96,10 @@ class SignedAction:
     """
 
     def sign(self, signer_private_key: str):
-        signer_wallet = Web3().eth.account.from_key(signer_private_key)
+        return self.sign_with_account(Account.from_key(signer_private_key))
+
+    def sign_with_account(self, signer_wallet: LocalAccount):
+        # Callers holding the session key wallet pass it directly, so the account is not re-derived from the key
         signature: Account = signer_wallet.unsafe_sign_hash(self._to_typed_data_hash())
         self.signature = signature.signature.hex()
         return self.signature
@@ -105,7 +127,7 @@ class SignedAction:
     @property
     def domain_separator(self) -> bytes:
         try:
-            return bytes.fromhex(self.DOMAIN_SEPARATOR[2:])
+            return _bytes_from_hex(self.DOMAIN_SEPARATOR)
         except ValueError:
             raise ValueError(
                 "Unable to extract bytes from DOMAIN_SEPARATOR. Ensure value is copied from Protocol Constants in docs.derive.xyz."
@@ -114,38 +136,27 @@ class SignedAction:
     @property
     def action_typehash(self) -> bytes:
         try:
-            return bytes.fromhex(self.ACTION_TYPEHASH[2:])
+            return _bytes_from_hex(self.ACTION_TYPEHASH)
         except ValueError:
             raise ValueError(
                 "Unable to extract bytes from ACTION_TYPEHASH. Ensure value is copied from Protocol Constants in docs.derive.xyz."
             )
 
     def _to_typed_data_hash(self) -> HexBytes:
-        encoded_typed_data_hash = "".join(["0x1901", self.DOMAIN_SEPARATOR[2:], self._get_action_hash().hex()])
-        return Web3.keccak(hexstr=encoded_typed_data_hash)
+        return Web3.keccak(b"\x19\x01" + self.domain_separator + self._get_action_hash())
 
     def _get_action_hash(self) -> HexBytes:
         return Web3.keccak(
-            encode(
-                [
-                    "bytes32",
-                    "uint",
-                    "uint",
-                    "address",
-                    "bytes32",
-                    "uint",
-                    "address",
-                    "address",
-                ],
-                [
+            _ACTION_ENCODER(
+                (
                     self.action_typehash,
                     self.subaccount_id,
                     self.nonce,
-                    Web3.to_checksum_address(self.module_address),
+                    to_checksum_address(self.module_address),
                     Web3.keccak(self.module_data.to_abi_encoded()),
                     self.signature_expiry_sec,
-                    Web3.to_checksum_address(self.owner),
-                    Web3.to_checksum_address(self.signer),
-                ],
+                    to_checksum_address(self.owner),
+                    to_checksum_address(self.signer),
+                )
             )
         )
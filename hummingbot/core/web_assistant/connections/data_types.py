@@ -1,4 +1,3 @@
-import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -117,11 +116,11 @@ class RESTResponse:
             byte_string = await self._aiohttp_response.read()
             if isinstance(byte_string, bytes):
                 decoded_string = byte_string.decode('utf-8')
-                json_ = json.loads(decoded_string)
+                json_ = ujson.loads(decoded_string)
             else:
-                json_ = await self._aiohttp_response.json()
+                json_ = await self._aiohttp_response.json(loads=ujson.loads)
         else:
-            json_ = await self._aiohttp_response.json()
+            json_ = await self._aiohttp_response.json(loads=ujson.loads)
         return json_
 
     async def text(self) -> str:
@@ -94,7 +94,7 @@ class DerivePerpetualAuthTests(TestCase):
         }
         request = MagicMock(method=RESTMethod.POST)
 
-        with patch("hummingbot.connector.derivative.derive_perpetual.derive_perpetual_auth.SignedAction.sign") as mock_sign, \
+        with patch("hummingbot.connector.derivative.derive_perpetual.derive_perpetual_auth.SignedAction.sign_with_account") as mock_sign, \
                 patch("hummingbot.connector.derivative.derive_perpetual.derive_perpetual_web_utils.order_to_call") as mock_order_to_call:
             mock_order_to_call.return_value = params
             mock_sign.return_value = None
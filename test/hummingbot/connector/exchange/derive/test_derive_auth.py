@@ -85,7 +85,7 @@ class DeriveAuthTests(TestCase):
         }
         request = MagicMock(method=RESTMethod.POST)
 
-        with patch("hummingbot.connector.exchange.derive.derive_auth.SignedAction.sign") as mock_sign, \
+        with patch("hummingbot.connector.exchange.derive.derive_auth.SignedAction.sign_with_account") as mock_sign, \
                 patch("hummingbot.connector.exchange.derive.derive_web_utils.order_to_call") as mock_order_to_call:
             mock_order_to_call.return_value = params
             mock_sign.return_value = None
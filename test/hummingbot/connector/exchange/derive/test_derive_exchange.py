@@ -1223,6 +1223,46 @@ class DeriveExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
         self.assertEqual(1, len(latest_prices))
         self.assertEqual(self.expected_latest_price, latest_prices[self.trading_pair])
 
+    @aioresponses()
+    def test_get_all_pairs_prices(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        url = self.latest_prices_url
+
+        response = self.latest_prices_request_mock_response
+
+        mock_api.post(url, body=json.dumps(response))
+
+        pairs_prices = self.async_run_with_timeout(self.exchange.get_all_pairs_prices())
+
+        self.assertEqual(1, len(pairs_prices))
+        self.assertEqual("BTC-USDC", pairs_prices[0]["symbol"]["instrument_name"])
+        self.assertEqual("1.6692", pairs_prices[0]["symbol"]["best_bid"])
+        self.assertEqual("1.6712", pairs_prices[0]["symbol"]["best_ask"])
+
+    @aioresponses()
+    def test_get_all_pairs_prices_skips_failed_instruments(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        url = self.latest_prices_url
+
+        mock_api.post(url, status=500)
+
+        pairs_prices = self.async_run_with_timeout(self.exchange.get_all_pairs_prices())
+
+        self.assertEqual([], pairs_prices)
+
+    @patch("hummingbot.connector.exchange.derive.derive_constants.TICKER_REQUEST_TIMEOUT", 0.01)
+    def test_get_all_pairs_prices_skips_timed_out_instruments(self):
+        self._simulate_trading_rules_initialized()
+
+        async def stalled_request(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        self.exchange._api_post = stalled_request
+
+        pairs_prices = self.async_run_with_timeout(self.exchange.get_all_pairs_prices())
+
+        self.assertEqual([], pairs_prices)
+
     def configure_trading_rules_response(
             self,
             mock_api: aioresponses,
@@ -153,3 +153,27 @@ class DexalotClientTests(TestCase):
         )
         result = self.async_run_with_timeout(self._tx_client.cancel_and_add_order_list([], [order]))
         self.assertEqual("79DBF373DE9C534EE2DC9D009F32B850DA8D0C73833FAA0FD52C6AE8989EC659", result)  # noqa: mock
+
+    @staticmethod
+    async def _chain_id_coroutine(chain_id: int) -> int:
+        return chain_id
+
+    def test_build_and_send_tx_tracks_nonce_locally_after_first_transaction(self):
+        self._tx_client.async_w3 = MagicMock()
+        self._tx_client.async_w3.eth.get_transaction_count = AsyncMock(return_value=5)
+        self._tx_client.async_w3.eth.send_raw_transaction = AsyncMock(return_value=bytes.fromhex("ab" * 32))
+        self._tx_client.async_w3.eth.chain_id = self._chain_id_coroutine(432204)
+        self._tx_client.account = MagicMock()
+        function = MagicMock()
+        function.build_transaction = AsyncMock(side_effect=lambda tx_params: tx_params)
+
+        self.async_run_with_timeout(self._tx_client._build_and_send_tx(function, gas=100))
+        self.async_run_with_timeout(self._tx_client._build_and_send_tx(function, gas=100))
+
+        self._tx_client.async_w3.eth.get_transaction_count.assert_awaited_once()
+        sent_nonces = [call.args[0]["nonce"] for call in function.build_transaction.call_args_list]
+        self.assertEqual([5, 6], sent_nonces)
+        sent_chain_ids = [call.args[0]["chainId"] for call in function.build_transaction.call_args_list]
+        self.assertEqual([432204, 432204], sent_chain_ids)
+        self.assertEqual(7, self._tx_client.last_nonce)
+        self.assertEqual(2, self._tx_client.account.sign_transaction.call_count)
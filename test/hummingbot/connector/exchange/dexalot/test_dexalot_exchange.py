@@ -16,6 +16,7 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.order_book import OrderBook
@@ -901,6 +902,47 @@ class DexalotExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
         # detect if the orders exists or not. That will happen when the transaction is executed.
         pass
 
+    def _start_tracking_orders_for_cancel_all(self) -> List[str]:
+        order_ids = [self.client_order_id_prefix + "1", self.client_order_id_prefix + "2"]
+        for index, order_id in enumerate(order_ids):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=self.exchange_order_id_prefix + str(index + 1),
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        return order_ids
+
+    @patch.object(CONSTANTS, "CANCEL_ALL_CONFIRMATION_TIMEOUT", 10)
+    async def test_cancel_all_returns_once_cancelled_orders_are_no_longer_active(self):
+        order_ids = self._start_tracking_orders_for_cancel_all()
+
+        async def execute_batch_cancel(orders_to_cancel):
+            for order_id in order_ids:
+                self.exchange._order_tracker.stop_tracking_order(client_order_id=order_id)
+            return [CancellationResult(order_id, True) for order_id in order_ids]
+
+        self.exchange._execute_batch_cancel = execute_batch_cancel
+
+        results = await asyncio.wait_for(self.exchange.cancel_all(timeout_seconds=1), timeout=1)
+
+        self.assertEqual([CancellationResult(order_id, True) for order_id in order_ids], results)
+
+    @patch.object(CONSTANTS, "CANCEL_ALL_CONFIRMATION_TIMEOUT", 0.3)
+    async def test_cancel_all_reports_failures_after_confirmation_deadline(self):
+        order_ids = self._start_tracking_orders_for_cancel_all()
+        self.exchange._execute_batch_cancel = AsyncMock(
+            return_value=[CancellationResult(order_ids[0], True), CancellationResult(order_ids[1], False)]
+        )
+
+        results = await asyncio.wait_for(self.exchange.cancel_all(timeout_seconds=1), timeout=1)
+
+        self.assertIn(order_ids[0], self.exchange._order_tracker.active_orders)
+        self.assertEqual([CancellationResult(order_ids[0], True), CancellationResult(order_ids[1], False)], results)
+
     @aioresponses()
     @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
     def test_update_time_synchronizer_successfully(self, mock_api, seconds_counter_mock):
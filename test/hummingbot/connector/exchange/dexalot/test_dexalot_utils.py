@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 
 from hummingbot.connector.exchange.dexalot import dexalot_utils as utils
 
@@ -26,3 +27,9 @@ class DexalotUtilTestCases(unittest.TestCase):
         }
 
         self.assertTrue(utils.is_exchange_information_valid(invalid_info_4))
+
+    def test_power_of_ten(self):
+        self.assertEqual(Decimal("1e-18"), utils.power_of_ten(-18))
+        self.assertEqual(Decimal("1e6"), utils.power_of_ten(Decimal("6")))
+        self.assertEqual(Decimal("1e-2"), utils.power_of_ten("-2"))
+        self.assertEqual(Decimal("1e-60"), utils.power_of_ten(-60))
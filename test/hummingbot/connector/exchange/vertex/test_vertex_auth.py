@@ -1,10 +1,17 @@
 import asyncio
+from decimal import Decimal
 from typing import Awaitable
 from unittest import TestCase
+from unittest.mock import AsyncMock, patch
+
+from eip712_structs import make_domain
 
 import hummingbot.connector.exchange.vertex.vertex_constants as CONSTANTS
 from hummingbot.connector.exchange.vertex.vertex_auth import VertexAuth
 from hummingbot.connector.exchange.vertex.vertex_eip712_structs import Order
+from hummingbot.connector.exchange.vertex.vertex_exchange import VertexExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSJSONRequest
 
 
@@ -61,6 +68,53 @@ class VertexAuthTests(TestCase):
         self.assertEqual(expected_signature, signature)
         self.assertEqual(expected_digest, digest)
 
+    def test_sign_payload_reuses_domain(self):
+        order = Order(
+            sender="0x2162Db26939B9EAF0C5404217774d166056d31B5",  # noqa: mock
+            priceX18=26383000000000000000000,
+            amount=2292000000000000000,
+            expiration=1685989016166771694,
+            nonce=1767924162661187978,
+        )
+        contract = "0xbf16e41fb4ac9922545bfc1500f67064dc2dcc3b"  # noqa: mock
+        chain_id = "421613"
+        first_signature, first_digest = self.auth.sign_payload(order, contract, chain_id)
+        domain = self.auth._get_domain(contract=contract, chain_id=chain_id)
+        second_signature, second_digest = self.auth.sign_payload(order, contract, chain_id)
+
+        self.assertIs(domain, self.auth._get_domain(contract=contract, chain_id=chain_id))
+        self.assertEqual(1, len(self.auth._domains))
+        self.assertEqual(first_signature, second_signature)
+        self.assertEqual(first_digest, second_digest)
+
+    def test_exchange_reuses_domain_across_signatures(self):
+        exchange = VertexExchange(
+            vertex_arbitrum_address=self.sender_address,
+            vertex_arbitrum_private_key=self.private_key,
+            trading_pairs=["wBTC-USDC"],
+            domain=CONSTANTS.TESTNET_DOMAIN,
+        )
+        exchange._exchange_market_info = {CONSTANTS.TESTNET_DOMAIN: {1: {"market": "wBTC/USDC", "symbol": "wBTC"}}}
+        exchange._api_post = AsyncMock(return_value={"status": "success"})
+        exchange._update_balances = AsyncMock()
+        order = InFlightOrder(
+            client_order_id="ABC1",
+            exchange_order_id="0x7b76413f438b5dfe8ba10ebe5b9e2ac2b8a7da6d9c2c4ba6ae0a2a3a9d9a5b40",  # noqa: mock
+            trading_pair="wBTC-USDC",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("26000"),
+            creation_timestamp=1640001112.223,
+        )
+
+        with patch("hummingbot.connector.exchange.vertex.vertex_auth.make_domain", wraps=make_domain) as make_domain_mock:
+            self.assertTrue(self.async_run_with_timeout(exchange._place_cancel(order.client_order_id, order)))
+            self.assertTrue(self.async_run_with_timeout(exchange._place_cancel(order.client_order_id, order)))
+
+        self.assertEqual(1, make_domain_mock.call_count)
+        self.assertEqual(1, len(exchange._auth._domains))
+
     def test_generate_digest(self):
         signable_bytes = b"\x19\x01\xb0_\xd0\xc1Co\xf9K\xb2C$*S\x8f\xd78\xac\xc3\xdcdu\xf0\xfcY\x9d9\xac\xe7\xff/\xa6)\x1fp-\xfcL\x9d\xdf\xe8\xbb\xffe\x0bJIl\x14\x94\x89\xc9{\x9af\x97\xad2\x13\x8a1\xca\x89\xfa\xd3"  # noqa: mock
         expected_digest = "0xaa4dadc6a1ed641eb46a22b1b58fd702e60392b8593e3fb29a5218f7f4010e69"  # noqa: mock
@@ -624,6 +624,38 @@ class TestVertexExchange(unittest.TestCase):
 
         self.assertEqual(Decimal("0.0002"), fee.percent)  # default fee
 
+    def test_get_fee_reuses_fee_instance_for_same_rate(self):
+        first_fee = self.exchange.get_fee(
+            base_currency="wBTC",
+            quote_currency="USDC",
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY,
+            amount=Decimal("10"),
+            price=Decimal("20"),
+        )
+        second_fee = self.exchange.get_fee(
+            base_currency="wBTC",
+            quote_currency="USDC",
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.SELL,
+            amount=Decimal("1"),
+            price=Decimal("30"),
+        )
+
+        self.assertIs(first_fee, second_fee)
+
+        self.exchange._trading_fees = {self.trading_pair: {"maker": Decimal("0.0"), "taker": Decimal("0.0004")}}
+        updated_fee = self.exchange.get_fee(
+            base_currency="wBTC",
+            quote_currency="USDC",
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY,
+            amount=Decimal("10"),
+            price=Decimal("20"),
+        )
+
+        self.assertEqual(Decimal("0.0004"), updated_fee.percent)
+
     @patch("hummingbot.connector.utils.get_tracking_nonce")
     def test_client_order_id_on_order(self, mocked_nonce):
         mocked_nonce.return_value = 9
@@ -1161,6 +1193,42 @@ class TestVertexExchange(unittest.TestCase):
         self.assertNotIn(order.client_order_id, self.exchange.in_flight_orders)
         self.assertTrue(self._is_logged("INFO", f"BUY order {order.client_order_id} completely filled."))
 
+    @aioresponses()
+    def test_all_trade_updates_for_order_shares_matches_within_tick(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        digest = "0x7b76413f438b5dd83550901304d8afed47720358acbd923890cd9431a58d3092"  # noqa: mock
+
+        self.exchange.start_tracking_order(
+            order_id=digest,
+            exchange_order_id=digest,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("25000"),
+            amount=Decimal("1"),
+        )
+        order: InFlightOrder = self.exchange.in_flight_orders[digest]
+
+        matches_url = web_utils.public_rest_url(CONSTANTS.INDEXER_PATH_URL, domain=self.domain)
+        matches_requests = []
+        mock_api.post(
+            matches_url,
+            body=json.dumps(self.get_matches_filled_mock()),
+            repeat=True,
+            callback=lambda *args, **kwargs: matches_requests.append(kwargs),
+        )
+
+        first_updates = self.async_run_with_timeout(self.exchange._all_trade_updates_for_order(order))
+        second_updates = self.async_run_with_timeout(self.exchange._all_trade_updates_for_order(order))
+
+        self.assertEqual(1, len(matches_requests))
+        self.assertEqual([u.trade_id for u in first_updates], [u.trade_id for u in second_updates])
+
+        self.exchange._set_current_timestamp(1640780010)
+        self.async_run_with_timeout(self.exchange._all_trade_updates_for_order(order))
+
+        self.assertEqual(2, len(matches_requests))
+
     @aioresponses()
     def test_update_order_status_when_cancelled(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
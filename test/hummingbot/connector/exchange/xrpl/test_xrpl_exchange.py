@@ -4,6 +4,7 @@ from decimal import Decimal
 from unittest.async_case import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+from cachetools import TTLCache
 from xrpl.asyncio.clients import XRPLRequestFailureException
 from xrpl.models import XRP, IssuedCurrency, OfferCancel, Request, Response, Transaction
 from xrpl.models.requests.request import RequestMethod
@@ -5134,7 +5135,9 @@ class XRPLExchangeUnitTests(IsolatedAsyncioTestCase):
         """Test that minimum update interval is configured correctly"""
         self.assertEqual(self.connector._min_update_interval_seconds, 0.5)
         self.assertIsInstance(self.connector._order_status_locks, dict)
-        self.assertIsInstance(self.connector._order_last_update_timestamps, dict)
+        self.assertIsInstance(self.connector._order_last_update_timestamps, TTLCache)
+        self.assertEqual(CONSTANTS.ORDER_LAST_UPDATE_CACHE_MAX_SIZE, self.connector._order_last_update_timestamps.maxsize)
+        self.assertEqual(CONSTANTS.ORDER_LAST_UPDATE_CACHE_TTL, self.connector._order_last_update_timestamps.ttl)
 
     @patch("time.time")
     def test_timing_enforcement_edge_cases(self, mock_time):
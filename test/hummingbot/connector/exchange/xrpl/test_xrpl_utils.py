@@ -334,6 +334,34 @@ class TestXRPLUtils(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(response.result["validated"], True)
         self.assertEqual(response.result["meta"]["TransactionResult"], "tesSUCCESS")
 
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils.get_latest_validated_ledger_sequence")
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_utils._sleep")
+    async def test_wait_for_final_transaction_outcome_backs_off_between_polls(self, sleep_mock, ledger_sequence_mock):
+        ledger_sequence_mock.return_value = 100
+        client = AsyncMock()
+        pending_response = Response(status=ResponseStatus.SUCCESS, result={"validated": False})
+        not_found_response = Response(status=ResponseStatus.ERROR, result={"error": "txnNotFound"})
+        validated_response = Response(
+            status=ResponseStatus.SUCCESS,
+            result={"validated": True, "meta": {"TransactionResult": "tesSUCCESS"}},
+        )
+        client._request_impl.side_effect = [
+            not_found_response,
+            pending_response,
+            pending_response,
+            pending_response,
+            pending_response,
+            validated_response,
+        ]
+
+        response = await _wait_for_final_transaction_outcome("transaction_hash", client, "tesSUCCESS", 200)
+
+        self.assertEqual(validated_response, response)
+        self.assertEqual(
+            [0.25, 0.5, 1.0, 2.0, 2.0, 2.0],
+            [call.args[0] for call in sleep_mock.call_args_list],
+        )
+
 
 class TestRateLimiter(IsolatedAsyncioWrapperTestCase):
     def setUp(self):
@@ -0,0 +1,37 @@
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.connector.gateway.gateway_lp import GatewayLp
+
+
+class GatewayBaseTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.connector = GatewayLp(
+            connector_name="uniswap/amm",
+            chain="ethereum",
+            network="mainnet",
+            address="0xwallet123",
+            trading_pairs=["ETH-USDC"]
+        )
+        self.connector._gateway_instance = MagicMock()
+
+    @patch("hummingbot.connector.gateway.gateway_base.GatewayHttpClient.get_instance")
+    async def test_get_token_by_address(self, mock_get_instance):
+        """Test token lookup by address after loading token data"""
+        mock_get_instance.return_value.get_tokens = AsyncMock(return_value={
+            "tokens": [
+                {"symbol": "ETH", "address": "0xAbC123", "decimals": 18},
+                {"symbol": "USDC", "address": "0xDef456", "decimals": 6},
+                {"symbol": "SOL", "address": None, "decimals": 9},
+                {"symbol": "BTC", "decimals": 8},
+            ]
+        })
+
+        await self.connector.load_token_data()
+
+        self.assertEqual("ETH", self.connector.get_token_by_address("0xabc123")["symbol"])
+        self.assertEqual("USDC", self.connector.get_token_by_address("0xDEF456")["symbol"])
+        self.assertIsNone(self.connector.get_token_by_address("0x789"))
+        self.assertIsNone(self.connector.get_token_by_address(""))
+        self.assertEqual("SOL", self.connector.get_token_info("SOL")["symbol"])
@@ -135,3 +135,20 @@ def test_signed_action_sign_and_validate(signed_action):
 
     # Run validate_signature() to ensure it works
     signed_action.validate_signature()
+
+
+def test_signed_action_sign_with_account_matches_private_key_signature(signed_action):
+    private_key = "0x4c0883a69102937d6231471b5dbb6204fe512961708279ca6f297d6b50ab8148"  # noqa: mock
+
+    signature = signed_action.sign_with_account(Account.from_key(private_key))
+
+    assert signature == signed_action.sign(private_key)
+    assert signature == signed_action.signature
+
+
+def test_typed_data_hash_matches_eip712_encoding(signed_action):
+    expected_hash = Web3.keccak(
+        hexstr="0x1901" + signed_action.DOMAIN_SEPARATOR[2:] + bytes(signed_action._get_action_hash()).hex()
+    )
+
+    assert signed_action._to_typed_data_hash() == expected_hash
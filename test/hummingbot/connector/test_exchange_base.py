@@ -0,0 +1,58 @@
+import unittest
+from decimal import Decimal
+from typing import Dict
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class MockExchange(ExchangeBase):
+
+    def __init__(self):
+        super().__init__()
+        self.order_books: Dict[str, OrderBook] = {}
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_books[trading_pair]
+
+
+class ExchangeBaseUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockExchange()
+        for trading_pair in ["COINALPHA-HBOT", "COINBETA-HBOT"]:
+            self.exchange.order_books[trading_pair] = OrderBook()
+
+    def test_last_trade_price_reused_while_unchanged(self):
+        self.exchange.order_books["COINALPHA-HBOT"].last_trade_price = 10.5
+
+        first_price = self.exchange.get_price_by_type("COINALPHA-HBOT", PriceType.LastTrade)
+        second_price = self.exchange.get_price_by_type("COINALPHA-HBOT", PriceType.LastTrade)
+
+        self.assertEqual(Decimal("10.5"), first_price)
+        self.assertIs(first_price, second_price)
+
+    def test_last_trade_price_refreshed_after_new_trade(self):
+        order_book = self.exchange.order_books["COINALPHA-HBOT"]
+        order_book.last_trade_price = 10.5
+        first_price = self.exchange.get_price_by_type("COINALPHA-HBOT", PriceType.LastTrade)
+
+        order_book.last_trade_price = 11.25
+        second_price = self.exchange.get_price_by_type("COINALPHA-HBOT", PriceType.LastTrade)
+        third_price = self.exchange.get_price_by_type("COINALPHA-HBOT", PriceType.LastTrade)
+
+        self.assertEqual(Decimal("10.5"), first_price)
+        self.assertEqual(Decimal("11.25"), second_price)
+        self.assertIs(second_price, third_price)
+
+    def test_last_trade_price_cached_per_trading_pair(self):
+        self.exchange.order_books["COINALPHA-HBOT"].last_trade_price = 10.5
+        self.exchange.order_books["COINBETA-HBOT"].last_trade_price = 20.0
+
+        alpha_price = self.exchange.get_price_by_type("COINALPHA-HBOT", PriceType.LastTrade)
+        beta_price = self.exchange.get_price_by_type("COINBETA-HBOT", PriceType.LastTrade)
+
+        self.assertEqual(Decimal("10.5"), alpha_price)
+        self.assertEqual(Decimal("20"), beta_price)
+        self.assertIs(alpha_price, self.exchange.get_price_by_type("COINALPHA-HBOT", PriceType.LastTrade))